@@ -0,0 +1,84 @@
+"""
+Decoration time per function of programmatically generated `bind_jit` kernels, as in `test_nested_jit`,
+with the generated-source path (`namespace=True`) and the registry path (`namespace=False`).
+`numba_linking` is imported from the checkout the script is part of:
+
+    python benchmarks/bench_decoration.py --n 10000 --output decoration.json
+"""
+import argparse
+import datetime
+import json
+import numba
+import os
+import platform
+import sys
+import time
+import types
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from numba_linking.bind_jit import bind_jit  # noqa: E402
+
+
+kernel_template = """
+def {name}(x):
+    return x + {i}.0
+"""
+
+sig = numba.float64(numba.float64)
+
+modes = {
+    'namespace_lazy': dict(lazy=True),
+    'registry_lazy': dict(lazy=True, namespace=False),
+    'namespace_eager': dict(),
+    'registry_eager': dict(namespace=False),
+}
+
+
+def make_kernels(mode, n):
+    module = types.ModuleType(f'bench_decoration_{mode}')
+    module.__file__ = __file__
+    sys.modules[module.__name__] = module
+    for i in range(n):
+        exec(compile(kernel_template.format(name=f'{mode}_{i}', i=i), __file__, mode='exec'), module.__dict__)
+    return [module.__dict__[f'{mode}_{i}'] for i in range(n)]
+
+
+def bench_mode(mode, n):
+    kernels = make_kernels(mode, n)
+    decorator = bind_jit(sig, **modes[mode])
+    start = time.perf_counter()
+    wrappers = [decorator(kernel) for kernel in kernels]
+    decorate_s = time.perf_counter() - start
+    start = time.perf_counter()
+    assert wrappers[-1](1.0) == float(n)
+    first_call_s = time.perf_counter() - start
+    return dict(mode=mode, n=n, decorate_us=1e6 * decorate_s / n, first_call_ms=1e3 * first_call_s)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=10_000, help="functions decorated lazily")
+    parser.add_argument('--n-eager', type=int, default=100, help="functions decorated and compiled")
+    parser.add_argument('--modes', nargs='+', default=list(modes))
+    parser.add_argument('--output', default=None, help="JSON file, printed to stdout if not given")
+    args = parser.parse_args(argv)
+    results = []
+    for mode in args.modes:
+        results.append(bench_mode(mode, args.n_eager if mode.endswith('eager') else args.n))
+        print(results[-1], file=sys.stderr)
+    meta = dict(
+        date=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        python=platform.python_version(), numba=numba.__version__, machine=platform.machine(),
+    )
+    report = json.dumps(dict(meta=meta, results=results), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(report)
+
+
+if __name__ == '__main__':
+    main()
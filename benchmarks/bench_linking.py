@@ -0,0 +1,365 @@
+"""
+Compares the linking strategies of this repo: plain `njit` inlining, `bind_jit` (cfunc and native ABI),
+calling a `cfunc`, a hand-written intrinsic as in `make_jit`, static and dynamic MCJIT linking as in `make_llvm`,
+and linking in one LLJIT session with `orc.OrcLinker`.
+
+For each Numba strategy and call-graph depth a module is generated, in which every level of a chain of functions
+calls the previous one, as in `test_nested_jit`, and a `run` loop calls the last one.
+The module runs twice in a fresh process with an empty `NUMBA_CACHE_DIR`, to measure cold and warm start,
+and reports its compile time and per-call time.
+The LLVM strategies build the same chain as LLVM modules in this process, one module per level unless linked statically;
+their warm compile loads the object code their cold compile emitted, as Numba's cache does.
+Results are written as JSON. `numba_linking` is imported from the checkout the script is part of:
+
+    python benchmarks/bench_linking.py --depths 1 99 --output bench.json
+"""
+import argparse
+import ctypes
+import datetime
+import json
+import llvmlite
+import llvmlite.binding as ll
+import llvmlite.ir as ir
+import numba
+import numpy as np
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_dir)
+
+from numba_linking.orc import OrcLinker, get_host_target_machine, optimize_module  # noqa: E402
+
+
+header_template = """
+import time
+start = time.perf_counter()
+import json
+import numba
+import numpy as np
+from llvmlite import ir
+from numba.core import cgutils
+from numba.experimental.function_type import _get_wrapper_address
+from numba.extending import intrinsic
+import llvmlite.binding as ll
+from numba_linking.bind_jit import bind_jit
+
+sig = numba.float64(numba.float64)
+"""
+
+level_0_template = """
+@{decorator}
+def f_0(x):
+    return 2.0 * x
+"""
+
+level_template = """
+@{decorator}
+def f_{i}(x):
+    return 1.{i} * f_{j}(x)
+"""
+
+intrinsic_level_0_template = """
+@numba.njit(sig, cache=True)
+def f_0_prototype(x):
+    return 2.0 * x
+"""
+
+intrinsic_level_template = """
+@numba.njit(sig, cache=True)
+def f_{i}_prototype(x):
+    return 1.{i} * f_{j}(x)
+"""
+
+intrinsic_template = """
+ll.add_symbol("f_{i}_symbol", _get_wrapper_address(f_{i}_prototype, sig))
+
+
+@intrinsic
+def _f_{i}(typingctx, x_t):
+    def codegen(context, builder, signature, args):
+        double_t = ir.DoubleType()
+        f_t = ir.FunctionType(double_t, (double_t,))
+        f_ = cgutils.get_or_insert_function(builder.module, f_t, "f_{i}_symbol")
+        return builder.call(f_, args)
+    return sig, codegen
+
+
+@numba.njit(sig, cache=True)
+def f_{i}(x):
+    return _f_{i}(x)
+"""
+
+footer_template = """
+@numba.njit(cache=True)
+def run(a):
+    s = 0.0
+    for x in a:
+        s += f_{depth}(x)
+    return s
+
+
+a = np.random.rand({n})
+run(a)
+compile_s = time.perf_counter() - start
+per_call_ns = []
+for _ in range({repeat}):
+    t0 = time.perf_counter()
+    run(a)
+    per_call_ns.append(1e9 * (time.perf_counter() - t0) / a.size)
+print(json.dumps(dict(compile_s=compile_s, per_call_ns=min(per_call_ns))))
+"""
+
+decorators = {
+    'njit': "numba.njit(sig, cache=True)",
+    'bind_jit': "bind_jit(sig, cache=True)",
+    'bind_jit_native': "bind_jit(sig, abi='native', cache=True)",
+    'cfunc': "numba.cfunc(sig, cache=True)",
+}
+numba_strategies = list(decorators) + ['intrinsic']
+llvm_strategies = ['mcjit_static', 'mcjit_dynamic', 'orc']
+
+
+def make_module_code(strategy, depth, n, repeat):
+    code = [header_template]
+    for i in range(depth + 1):
+        if strategy == 'intrinsic':
+            code.append(intrinsic_level_template.format(i=i, j=i - 1) if i else intrinsic_level_0_template)
+            code.append(intrinsic_template.format(i=i))
+        else:
+            template = level_template if i else level_0_template
+            code.append(template.format(i=i, j=i - 1, decorator=decorators[strategy]))
+    code.append(footer_template.format(depth=depth, n=n, repeat=repeat))
+    return '\n'.join(code)
+
+
+def get_cache_size(cache_dir):
+    size = 0
+    for root, _, files in os.walk(cache_dir):
+        size += sum(os.path.getsize(os.path.join(root, f)) for f in files if f.endswith(('.nbi', '.nbc')))
+    return size
+
+
+def run_module(module_path, cache_dir):
+    env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir, PYTHONPATH=repo_dir)
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, module_path], env=env, check=True, capture_output=True, text=True).stdout
+    return time.perf_counter() - start, json.loads(out.splitlines()[-1])
+
+
+def bench_numba_strategy(strategy, depth, n, repeat, tmp_dir):
+    module_path = os.path.join(tmp_dir, f'bench_{strategy}_{depth}.py')
+    with open(module_path, 'w') as f:
+        f.write(make_module_code(strategy, depth, n, repeat))
+    cache_dir = os.path.join(tmp_dir, f'cache_{strategy}_{depth}')
+    cold_start_s, cold = run_module(module_path, cache_dir)
+    warm_start_s, warm = run_module(module_path, cache_dir)
+    return dict(
+        strategy=strategy, depth=depth, per_call_ns=warm['per_call_ns'], compile_s=cold['compile_s'],
+        warm_compile_s=warm['compile_s'], cache_bytes=get_cache_size(cache_dir),
+        cold_start_s=cold_start_s, warm_start_s=warm_start_s,
+    )
+
+
+double_t = ir.DoubleType()
+i64_t = ir.IntType(64)
+
+
+def get_level_name(prefix, i):
+    return f"{prefix}_f_{i}"
+
+
+def get_factor(depth):
+    """ What the chain of `depth` levels above level 0 multiplies its argument by """
+    return 2.0 * np.prod([float(f"1.{i}") for i in range(1, depth + 1)])
+
+
+def make_level_module(prefix, i, linkage='external'):
+    """ `double {prefix}_f_{i}(double x)`, `2.0 * x` for level 0 and `1.i * {prefix}_f_{i - 1}(x)` above it """
+    module = ir.Module(name=get_level_name(prefix, i))
+    func = ir.Function(module, ir.FunctionType(double_t, [double_t]), name=get_level_name(prefix, i))
+    func.linkage = linkage
+    builder = ir.IRBuilder(func.append_basic_block())
+    if i == 0:
+        builder.ret(builder.fmul(func.args[0], ir.Constant(double_t, 2.0)))
+    else:
+        callee = ir.Function(module, func.function_type, name=get_level_name(prefix, i - 1))
+        builder.ret(builder.fmul(builder.call(callee, func.args), ir.Constant(double_t, float(f"1.{i}"))))
+    return module
+
+
+def make_loop_module(prefix, depth):
+    """ `double {prefix}_loop(double* a, i64 n)` summing `{prefix}_f_{depth}(a[i])`, which is declared only """
+    module = ir.Module(name=f"{prefix}_loop")
+    func = ir.Function(module, ir.FunctionType(double_t, [double_t]), name=get_level_name(prefix, depth))
+    loop = ir.Function(module, ir.FunctionType(double_t, [double_t.as_pointer(), i64_t]), name=f"{prefix}_loop")
+    a, n = loop.args
+    entry = loop.append_basic_block('entry')
+    body = loop.append_basic_block('body')
+    end = loop.append_basic_block('end')
+    builder = ir.IRBuilder(entry)
+    builder.cbranch(builder.icmp_signed('>', n, ir.Constant(i64_t, 0)), body, end)
+    builder.position_at_end(body)
+    i = builder.phi(i64_t)
+    s = builder.phi(double_t)
+    s_next = builder.fadd(s, builder.call(func, [builder.load(builder.gep(a, [i]))]))
+    i_next = builder.add(i, ir.Constant(i64_t, 1))
+    i.add_incoming(ir.Constant(i64_t, 0), entry)
+    i.add_incoming(i_next, body)
+    s.add_incoming(ir.Constant(double_t, 0.0), entry)
+    s.add_incoming(s_next, body)
+    builder.cbranch(builder.icmp_signed('<', i_next, n), body, end)
+    builder.position_at_end(end)
+    res = builder.phi(double_t)
+    res.add_incoming(ir.Constant(double_t, 0.0), entry)
+    res.add_incoming(s_next, body)
+    builder.ret(res)
+    return module
+
+
+def parse_module(module):
+    module_ref = ll.parse_assembly(str(module))
+    module_ref.name = module.name
+    return module_ref
+
+
+def make_modules(strategy, prefix, depth):
+    """ LLVM modules of the chain and its loop, in the order they are linked, the loop last """
+    if strategy == 'mcjit_static':
+        loop_module = parse_module(make_loop_module(prefix, depth))
+        # a linkonce_odr definition not referenced yet is dropped, so each level is linked after its caller
+        for i in reversed(range(depth + 1)):
+            loop_module.link_in(parse_module(make_level_module(prefix, i, 'linkonce_odr')))
+        return [loop_module]
+    modules = [make_level_module(prefix, i) for i in range(depth + 1)] + [make_loop_module(prefix, depth)]
+    return [parse_module(module) for module in modules]
+
+
+def compile_engine(module, objects):
+    """ MCJIT engine of `module`, its object code loaded from `objects` if there, else compiled and added to it """
+    module.verify()
+    name = module.name
+    if name not in objects:
+        optimize_module(module)
+    engine = ll.create_mcjit_compiler(module, get_host_target_machine())
+    engine.set_object_cache(lambda _, buffer: objects.__setitem__(name, buffer), lambda _: objects.get(name))
+    engine.finalize_object()
+    return engine
+
+
+def link_mcjit(modules, objects):
+    """ Address of the loop, each module compiled in an engine of its own, which later modules find by symbol """
+    engines = []
+    for module in modules:
+        engines.append(compile_engine(module, objects))
+        ll.add_symbol(module.name, engines[-1].get_function_address(module.name))
+    return engines, engines[-1].get_function_address(modules[-1].name)
+
+
+def link_orc(modules, objects):
+    """ Address of the loop in an `OrcLinker` session, the object code of each module then emitted into `objects` """
+    linker = OrcLinker()
+    for module in modules:
+        linker.add_module(linker.prepare_module(module), module.name)
+    loop_p = linker.get_address(modules[-1].name)
+    for module in modules:
+        objects[module.name] = linker.target_machine.emit_object(module)
+    return linker, loop_p
+
+
+def load_orc(modules, objects):
+    """ Address of the loop in a new LLJIT session loading the object code `link_orc` emitted """
+    lljit = ll.create_lljit_compiler(get_host_target_machine())
+    names = [module.name for module in modules]
+    trackers = []
+    for i, name in enumerate(names):
+        builder = ll.JITLibraryBuilder().add_object_img(objects[name])
+        for dependency in names[:i]:
+            builder.add_jit_library(dependency)
+        trackers.append(builder.add_current_process().link(lljit, name))
+    trackers.append(lljit.lookup(names[-1], names[-1]))
+    return (lljit, trackers), trackers[-1][names[-1]]
+
+
+def link_llvm_strategy(strategy, prefix, depth, objects):
+    """ Holder of the compiled code and address of the loop, loaded from `objects` when they hold its object code """
+    modules = make_modules(strategy, prefix, depth)
+    if strategy != 'orc':
+        return link_mcjit(modules, objects)
+    if objects:
+        return load_orc(modules, objects)
+    return link_orc(modules, objects)
+
+
+def time_loop(loop_p, factor, n, repeat):
+    loop = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p, ctypes.c_int64)(loop_p)
+    a = np.random.rand(n)
+    per_call_ns = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        loop(a.ctypes.data, a.size)
+        per_call_ns.append(1e9 * (time.perf_counter() - t0) / a.size)
+    assert np.isclose(loop(a.ctypes.data, a.size), factor * a.sum())
+    return min(per_call_ns)
+
+
+def bench_llvm_strategy(strategy, depth, n, repeat):
+    ll.initialize()
+    ll.initialize_native_target()
+    ll.initialize_native_asmprinter()
+    prefix = f"bench_{strategy}_{depth}"
+    objects = {}
+    start = time.perf_counter()
+    cold, loop_p = link_llvm_strategy(strategy, prefix, depth, objects)
+    compile_s = time.perf_counter() - start
+    per_call_ns = time_loop(loop_p, get_factor(depth), n, repeat)
+    start = time.perf_counter()
+    warm, warm_loop_p = link_llvm_strategy(strategy, prefix, depth, objects)
+    warm_compile_s = time.perf_counter() - start
+    time_loop(warm_loop_p, get_factor(depth), n, 1)
+    return dict(
+        strategy=strategy, depth=depth, per_call_ns=per_call_ns, compile_s=compile_s, warm_compile_s=warm_compile_s,
+        cache_bytes=sum(len(obj) for obj in objects.values()),
+    )
+
+
+def get_meta():
+    return dict(
+        date=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        python=platform.python_version(), numba=numba.__version__, llvmlite=llvmlite.__version__,
+        numpy=np.__version__, cpu=ll.get_host_cpu_name(), machine=platform.machine(),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--depths', type=int, nargs='+', default=[1, 99])
+    parser.add_argument('--strategies', nargs='+', default=numba_strategies + llvm_strategies)
+    parser.add_argument('--n', type=int, default=1_000_000, help="calls per timed run")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default=None, help="JSON file, printed to stdout if not given")
+    args = parser.parse_args(argv)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for strategy in args.strategies:
+            for depth in args.depths:
+                if strategy in llvm_strategies:
+                    results.append(bench_llvm_strategy(strategy, depth, args.n, args.repeat))
+                else:
+                    results.append(bench_numba_strategy(strategy, depth, args.n, args.repeat, tmp_dir))
+                print(results[-1], file=sys.stderr)
+    report = json.dumps(dict(meta=get_meta(), results=results), indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import argparse
+
+from numba_linking.aot import build_shared_library, import_package_modules
+from numba_linking.precompile import precompile
+from numba_linking.telemetry import dump_compile_records, enable_telemetry, get_compile_records
+
+
+def build_so(args):
+    manifest = build_shared_library(args.package, args.output)
+    print(f"{args.output}: {len(manifest['symbols'])} symbols, skipped {manifest['skipped']}")
+
+
+def precompile_package(args):
+    records = precompile(args.package, args.jobs)
+    for record in records:
+        status = 'not cacheable' if not record.cacheable else 'hit' if record.cache_hit else 'miss'
+        print(f"{record.symbol:60} {record.seconds:8.3f}s {status}")
+    cacheable = [record for record in records if record.cacheable]
+    hits = sum(record.cache_hit for record in cacheable)
+    print(
+        f"{len(records)} functions, {hits} cache hits, {len(cacheable) - hits} cache misses, "
+        f"{len(records) - len(cacheable)} not cacheable"
+    )
+
+
+def report_telemetry(args):
+    enable_telemetry()
+    import_package_modules(args.package)
+    dump_compile_records(args.output)
+    records = get_compile_records()
+    seconds = sum(record.callee_s + record.wrapper_address_s + record.wrapper_s for record in records)
+    print(f"{args.output}: {len(records)} symbols, {seconds:.3f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m numba_linking')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_so_parser = commands.add_parser('build-so', help="compile the bind_jit functions of a package into a shared library")
+    build_so_parser.add_argument('package')
+    build_so_parser.add_argument('-o', '--output', required=True)
+    build_so_parser.set_defaults(func=build_so)
+    precompile_parser = commands.add_parser('precompile', help="fill the on-disk cache of the bind_jit functions of a package")
+    precompile_parser.add_argument('package')
+    precompile_parser.add_argument('-j', '--jobs', type=int, default=None)
+    precompile_parser.set_defaults(func=precompile_package)
+    telemetry_parser = commands.add_parser(
+        'telemetry', help="import a package and report where binding its functions took time"
+    )
+    telemetry_parser.add_argument('package')
+    telemetry_parser.add_argument('-o', '--output', required=True)
+    telemetry_parser.set_defaults(func=report_telemetry)
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
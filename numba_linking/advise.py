@@ -0,0 +1,204 @@
+import inspect
+import typing
+from numba.core import ir, types
+from numba.core.registry import CPUDispatcher
+
+from numba_linking.bind_jit import bind_jit, func_sfx
+from numba_linking.infer_attrs import get_ir_size
+
+
+IR_SIZE = 'ir_size'
+CACHE_BYTES = 'cache_bytes'
+LLVM_S = 'llvm_s'
+METRICS = (IR_SIZE, CACHE_BYTES, LLVM_S)
+
+MIN_IR_SIZE = 100
+
+
+class CallNode(typing.NamedTuple):
+    """ njit function of a call graph, with its compiled signatures and the sizes of their libraries """
+    func: CPUDispatcher
+    sigs: typing.Tuple
+    callees: typing.Tuple
+    ir_size: int
+    cache_bytes: int
+    llvm_s: float
+
+
+class BindAdvice(typing.NamedTuple):
+    """ Whether to `bind_jit` one callee, and what doing only that would save over the whole call graph """
+    func: CPUDispatcher
+    sigs: typing.Tuple
+    ir_size: int
+    call_sites: int
+    copies: int
+    saved_ir_size: int
+    saved_cache_bytes: int
+    saved_llvm_s: float
+    bind: bool
+
+
+class Advice(typing.NamedTuple):
+    root: CPUDispatcher
+    nodes: typing.Dict[CPUDispatcher, CallNode]
+    callees: typing.List[BindAdvice]
+    totals: typing.Dict[str, float]
+    projected: typing.Dict[str, float]
+
+
+def is_bound_wrapper(func):
+    return func.py_func.__name__.endswith(func_sfx)
+
+
+def get_call_sites(cres):
+    """ njit dispatchers `cres` calls and their argument types, once per call site; none if `cres` was loaded from cache """
+    if cres.type_annotation is None:
+        return []
+    typemap = cres.type_annotation.typemap
+    call_sites = []
+    for expr, sig in cres.type_annotation.calltypes.items():
+        if not isinstance(expr, ir.Expr) or expr.op != 'call':
+            continue
+        func_t = typemap.get(expr.func.name)
+        if isinstance(func_t, types.Dispatcher) and isinstance(func_t.dispatcher, CPUDispatcher):
+            call_sites.append((func_t.dispatcher, sig.args))
+    return call_sites
+
+
+def get_cache_bytes(library):
+    """ Size of the object code and bitcode Numba's cache stores for `library` """
+    _, _, data = library.serialize_using_object_code()
+    return sum(len(part) for part in data)
+
+
+def get_call_graph(root):
+    """
+    Nodes of the njit functions reachable from the compiled signatures of `root`, and the number of call sites of each.
+    `bind_jit` wrappers are not followed, their callees are compiled into libraries of their own.
+    """
+    nodes, call_sites = {}, {}
+    todo = [(root, args) for args in root.overloads]
+    if not todo:
+        raise ValueError(f"Expected a dispatcher that compiled at least one signature, got {root}")
+    seen = set()
+    while todo:
+        func, args = todo.pop()
+        if (func, args) in seen:
+            continue
+        seen.add((func, args))
+        cres = func.overloads.get(args)
+        if cres is None:
+            continue
+        callees = [(callee, args_) for callee, args_ in get_call_sites(cres) if not is_bound_wrapper(callee)]
+        for callee, _ in callees:
+            call_sites[callee] = call_sites.get(callee, 0) + 1
+        node = nodes.get(func)
+        nodes[func] = CallNode(
+            func,
+            (node.sigs if node else ()) + (cres.signature,),
+            tuple(dict.fromkeys((node.callees if node else ()) + tuple(callee for callee, _ in callees))),
+            (node.ir_size if node else 0) + get_ir_size(cres.library),
+            (node.cache_bytes if node else 0) + get_cache_bytes(cres.library),
+            (node.llvm_s if node else 0.0) + cres.metadata.get('timers', {}).get('llvm_lock', 0.0),
+        )
+        todo.extend(callees)
+    return nodes, call_sites
+
+
+def get_descendants(nodes, func, bound=frozenset()):
+    """ Functions whose code is inlined into the library of `func`, i.e. reachable from it without calling a bound one """
+    descendants, todo = set(), list(nodes[func].callees)
+    while todo:
+        callee = todo.pop()
+        if callee in descendants or callee in bound:
+            continue
+        descendants.add(callee)
+        todo.extend(nodes[callee].callees)
+    return descendants
+
+
+def get_own(nodes, metric):
+    """
+    Estimates of the part of `metric` of each node not due to inlined callees,
+    assuming each library holds one copy of the code of each function reachable from it.
+    """
+    own = {}
+    order = sorted(nodes, key=lambda func: len(get_descendants(nodes, func)))
+    for func in order:
+        descendants = get_descendants(nodes, func)
+        own[func] = max(getattr(nodes[func], metric) - sum(own.get(d, 0) for d in descendants), 0)
+    return own
+
+
+def project(nodes, own, bound):
+    """ Sum of a metric over all libraries of the call graph, once the functions in `bound` are bound """
+    return sum(own[func] + sum(own[d] for d in get_descendants(nodes, func, bound)) for func in nodes)
+
+
+def advise(root, min_ir_size=MIN_IR_SIZE):
+    """
+    Walks the call graph of the compiled signatures of the njit function `root` and advises to `bind_jit`
+    the callees of at least `min_ir_size` LLVM instructions whose code is inlined into more than one library.
+    Savings are projected for the IR size, the cache size, and the time LLVM spends compiling the whole call graph.
+    """
+    nodes, call_sites = get_call_graph(root)
+    owns = {metric: get_own(nodes, metric) for metric in METRICS}
+    totals = {metric: project(nodes, owns[metric], frozenset()) for metric in METRICS}
+    callees = []
+    for func, node in nodes.items():
+        if func is root:
+            continue
+        copies = 1 + sum(func in get_descendants(nodes, caller) for caller in nodes)
+        saved = {metric: totals[metric] - project(nodes, owns[metric], frozenset([func])) for metric in METRICS}
+        bind = node.ir_size >= min_ir_size and copies > 1
+        callees.append(BindAdvice(
+            func, node.sigs, node.ir_size, call_sites[func], copies,
+            saved[IR_SIZE], saved[CACHE_BYTES], saved[LLVM_S], bind
+        ))
+    callees.sort(key=lambda callee: callee.saved_ir_size, reverse=True)
+    bound = frozenset(callee.func for callee in callees if callee.bind)
+    projected = {metric: project(nodes, owns[metric], bound) for metric in METRICS}
+    return Advice(root, nodes, callees, totals, projected)
+
+
+def get_global_names(code):
+    """ Names `code` and the code nested in it, e.g. of closures, look up in their globals """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= get_global_names(const)
+    return names
+
+
+def replace_globals(func, old, new):
+    """ Rebinds the globals `func` refers to that are `old` to `new`, in the namespace of the module defining `func` """
+    ns = func.py_func.__globals__
+    for name in get_global_names(func.py_func.__code__):
+        if ns.get(name) is old:
+            ns[name] = new
+
+
+def apply_advice(advice, **jit_options):
+    """
+    Binds the callees `advice` advises to bind, reusing their compiled overloads,
+    makes their callers' globals refer to the `bind_jit` functions, and recompiles the callers, callees first.
+    Returns the `bind_jit` functions by the dispatchers they replace.
+    The globals are rebound in the modules of the callers, only under the names the callers use,
+    but other functions and Python code of those modules then also see the `bind_jit` functions under those names.
+    """
+    nodes = advice.nodes
+    to_bind = {callee.func: callee for callee in advice.callees if callee.bind}
+    bound = {}
+    changed = set()
+    order = sorted(nodes, key=lambda func: len(get_descendants(nodes, func)))
+    for func in order:
+        if any(callee in changed for callee in nodes[func].callees):
+            for callee in nodes[func].callees:
+                if callee in bound:
+                    replace_globals(func, callee, bound[callee])
+            func.recompile()
+            changed.add(func)
+        if func in to_bind:
+            bound[func] = bind_jit(list(to_bind[func].sigs), **jit_options)(func)
+            changed.add(func)
+    return bound
@@ -0,0 +1,175 @@
+import ctypes
+import importlib
+import json
+import llvmlite.binding as ll
+import os
+import pkgutil
+import subprocess
+import tempfile
+import typing
+import warnings
+from numba.core import config
+
+from numba_linking.infer_attrs import get_library_module, infer_attributes
+from numba_linking.registry import NATIVE_ABI, get_code_hash, get_compile_result, get_package_symbols
+
+
+AOT_LIBS_ENV = 'NUMBA_LINKING_AOT_LIBS'
+MANIFEST_EXT = '.json'
+
+
+class AotSymbol(typing.NamedTuple):
+    sig: str
+    abi: str
+    address: int
+    attrs: frozenset
+    code_hash: typing.Optional[str]
+
+
+aot_symbols: typing.Dict[str, AotSymbol] = {}
+lib_handles: typing.Dict[str, ctypes.CDLL] = {}
+
+
+def get_manifest_path(lib_path):
+    return f"{os.path.splitext(lib_path)[0]}{MANIFEST_EXT}"
+
+
+def get_cpu_name():
+    return config.CPU_NAME or ll.get_host_cpu_name()
+
+
+def get_cpu_features():
+    return config.CPU_FEATURES or ll.get_host_cpu_features().flatten()
+
+
+def is_supported_by_host(cpu_features):
+    host_features = set(ll.get_host_cpu_features().flatten().split(','))
+    return all(feature in host_features for feature in cpu_features.split(',') if feature.startswith('+'))
+
+
+def load_shared_library(lib_path, manifest_path=None):
+    """
+    dlopen a library built by `build_shared_library` and make its symbols available to `bind_jit`,
+    which then registers their addresses instead of compiling the callees.
+    """
+    lib_path = os.path.abspath(lib_path)
+    if lib_path in lib_handles:
+        return lib_handles[lib_path]
+    with open(manifest_path or get_manifest_path(lib_path)) as f:
+        manifest = json.load(f)
+    if manifest['triple'] != ll.get_process_triple() or not is_supported_by_host(manifest['cpu_features']):
+        warnings.warn(f"Skipping {lib_path} built for {manifest['triple']} {manifest['cpu']}")
+        return None
+    lib = ctypes.CDLL(lib_path)
+    for symbol, entry in manifest['symbols'].items():
+        address = ctypes.cast(getattr(lib, symbol), ctypes.c_void_p).value
+        aot_symbols[symbol] = AotSymbol(
+            entry['sig'], entry['abi'], address, frozenset(entry['attrs']), entry.get('code_hash')
+        )
+    lib_handles[lib_path] = lib
+    return lib
+
+
+def load_env_libraries():
+    for lib_path in os.environ.get(AOT_LIBS_ENV, '').split(os.pathsep):
+        if lib_path:
+            load_shared_library(lib_path)
+
+
+def lookup_symbol(symbol, sig, abi, py_func):
+    """ The symbol of a loaded library built from the same bytecode as `py_func`, for `sig` and `abi`, if any """
+    aot_symbol = aot_symbols.get(symbol)
+    if aot_symbol is None or (aot_symbol.sig, aot_symbol.abi) != (str(sig), abi):
+        return None
+    # a library built before the implementation changed has the machine code of the old one
+    return aot_symbol if aot_symbol.code_hash == get_code_hash(py_func) else None
+
+
+def import_package_modules(package):
+    module = importlib.import_module(package)
+    for module_info in pkgutil.walk_packages(getattr(module, '__path__', []), prefix=f'{package}.'):
+        importlib.import_module(module_info.name)
+
+
+def is_process_symbol(name):
+    try:
+        getattr(ctypes.CDLL(None), name)
+    except AttributeError:
+        return False
+    return True
+
+
+def get_unresolved_symbols(module):
+    externals = [func.name for func in module.functions if func.is_declaration and not func.name.startswith('llvm.')]
+    externals += [gv.name for gv in module.global_variables if gv.is_declaration]
+    return [name for name in externals if not is_process_symbol(name)]
+
+
+def make_symbol_module(bound_symbol):
+    """
+    Parses the optimized module of a bound callee, renames the function callers call to the bound symbol
+    and internalizes everything else, so that modules of different callees can be linked together.
+    """
+    cres = get_compile_result(bound_symbol)
+    fndesc = cres.fndesc
+    func_name = fndesc.llvm_func_name if bound_symbol.abi == NATIVE_ABI else fndesc.llvm_cfunc_wrapper_name
+    module = ll.parse_assembly(str(get_library_module(cres.library)))
+    for func in module.functions:
+        if not func.is_declaration:
+            func.linkage = ll.Linkage.internal
+    for gv in module.global_variables:
+        if not gv.is_declaration:
+            gv.linkage = ll.Linkage.internal
+    func = module.get_function(func_name)
+    func.name = bound_symbol.symbol
+    func.linkage = ll.Linkage.external
+    return module, infer_attributes(cres, bound_symbol.abi == NATIVE_ABI)
+
+
+def create_target_machine():
+    target = ll.Target.from_triple(ll.get_process_triple())
+    return target.create_target_machine(
+        cpu=get_cpu_name(), features=get_cpu_features(), opt=3, reloc='pic', codemodel='default'
+    )
+
+
+def link_shared_library(object_path, lib_path):
+    cc = os.environ.get('CC', 'cc')
+    subprocess.run([cc, '-shared', '-o', lib_path, object_path, '-lm'], check=True)
+
+
+def build_shared_library(package, lib_path):
+    """
+    Compiles every `bind_jit` function of `package` into the shared library `lib_path`,
+    and writes a manifest of their symbols, signatures and bytecode hashes next to it.
+    Callees referencing symbols that only Numba's JIT can resolve, e.g. NRT, are skipped.
+    """
+    import_package_modules(package)
+    linked = ll.parse_assembly('')
+    linked.triple = ll.get_process_triple()
+    symbols = {}
+    skipped = []
+    for bound_symbol in get_package_symbols(package):
+        module, attrs = make_symbol_module(bound_symbol)
+        if get_unresolved_symbols(module):
+            skipped.append(bound_symbol.symbol)
+            continue
+        linked.link_in(module)
+        symbols[bound_symbol.symbol] = dict(
+            sig=str(bound_symbol.sig), abi=bound_symbol.abi, attrs=sorted(attrs),
+            code_hash=get_code_hash(bound_symbol.jit_func.py_func)
+        )
+    target_machine = create_target_machine()
+    linked.data_layout = str(target_machine.target_data)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        object_path = os.path.join(tmp_dir, 'bind_jit.o')
+        with open(object_path, 'wb') as f:
+            f.write(target_machine.emit_object(linked))
+        link_shared_library(object_path, lib_path)
+    manifest = dict(
+        triple=ll.get_process_triple(), cpu=get_cpu_name(), cpu_features=get_cpu_features(),
+        symbols=symbols, skipped=skipped
+    )
+    with open(get_manifest_path(lib_path), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
@@ -0,0 +1,64 @@
+import ctypes
+import llvmlite.binding as ll
+import os
+import typing
+
+from numba_linking.bind_jit import is_signature
+from numba_linking.bind_llvm import bind_symbol
+
+
+lib_handles: typing.Dict[str, ctypes.CDLL] = {}
+external_symbols: typing.Dict[typing.Tuple[str, str], int] = {}
+symbol_libraries: typing.Dict[str, str] = {}
+
+
+def normalize_lib_path(lib_path):
+    return os.path.abspath(lib_path) if os.path.isfile(lib_path) else lib_path
+
+
+def load_library(lib_path):
+    """ dlopen `lib_path`, a path or a name the dynamic loader finds, once per process """
+    lib_path = normalize_lib_path(lib_path)
+    if lib_path not in lib_handles:
+        lib_handles[lib_path] = ctypes.CDLL(lib_path)
+    return lib_handles[lib_path]
+
+
+def get_symbol_address(lib_path, symbol):
+    return ctypes.cast(getattr(load_library(lib_path), symbol), ctypes.c_void_p).value
+
+
+def register_external(lib_path, symbol):
+    """ Records that `symbol` is the one of `lib_path`, the linker has one symbol of each name """
+    lib_path = normalize_lib_path(lib_path)
+    registered = symbol_libraries.setdefault(symbol, lib_path)
+    if registered != lib_path:
+        raise ValueError(f"Symbol {symbol} of {lib_path} is already bound from {registered}")
+    return lib_path
+
+
+def resolve_external(lib_path, symbol):
+    key = register_external(lib_path, symbol), symbol
+    if key not in external_symbols:
+        external_symbols[key] = get_symbol_address(lib_path, symbol)
+        ll.add_symbol(symbol, external_symbols[key])
+    return external_symbols[key]
+
+
+def bind_external(lib_path, symbol, sig, lazy=False, **jit_options):
+    """
+    Makes the C function `symbol` of the shared library `lib_path` callable from njit code as `sig`,
+    callers declare and call `symbol` directly, so a symbol name can only be bound from one library.
+    The library is loaded and `symbol` looked up at binding, with `lazy=True` only the first time a caller is compiled,
+    which callers loaded from cache skip, so they need `lazy=False`.
+    """
+    if not is_signature(sig):
+        raise ValueError(f"Expected signature, got {sig}")
+    register_external(lib_path, symbol)
+    if not lazy:
+        resolve_external(lib_path, symbol)
+
+    def prepare(context):
+        resolve_external(lib_path, symbol)
+        return frozenset()
+    return bind_symbol(symbol, sig, prepare, jit_options)
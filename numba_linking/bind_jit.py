@@ -1,13 +1,33 @@
+import functools
 import inspect
 import llvmlite.binding as ll
 import numba
+import os
 import types
 import typing
 from llvmlite import ir
-from numba.core import cgutils
+from numba.core import cgutils, sigutils
+from numba.core.caching import NullCache
+from numba.core.itanium_mangler import mangle_args
 from numba.extending import intrinsic
 from numba.experimental.function_type import _get_wrapper_address
 
+from numba_linking.aot import load_env_libraries, lookup_symbol
+from numba_linking.dependencies import enable_cache_linking
+from numba_linking.infer_attrs import get_ir_size, infer_attributes, infer_cfunc_object_attributes, set_function_attributes
+from numba_linking.instrument import CALLS, INSTRUMENT_MODES, count_call, register_counter
+from numba_linking.multiversion import make_variant_dispatcher, select_variant
+from numba_linking.perf import record_compile_result, record_library
+from numba_linking.registry import (
+    BIND_JIT_SFX, C_ABI, NATIVE_ABI, add_resolver, bound_functions, get_specialized_func_name, register_attributes,
+    register_function, register_specializer, register_symbol
+)
+from numba_linking.swap import load_slot, set_slot
+from numba_linking.telemetry import CALLEE, WRAPPER_ADDRESS, register_wrapper, timed
+from numba_linking.vector_variants import (
+    VECTOR_WIDTHS, add_compiler_used, add_vector_variants, attach_vector_variants, is_vectorizable
+)
+
 
 _ = ir, intrinsic
 
@@ -15,7 +35,16 @@ PY_SFX = '_py'
 SIG_SFX = '_sig'
 JIT_OPTS_SFX = '_jit_options'
 JIT_SFX = '_jit'
-BIND_JIT_SFX = '_BIND_JIT_SFX'
+ATTRS_SFX = '_attrs'
+SELECT_SFX = '_select'
+BATCH_SFX = '_batch'
+
+BATCH_TARGETS = ('cpu', 'parallel')
+
+INLINE_AUTO = 'auto'
+INLINE_BUDGET = 50
+
+LAZY_ENV = 'NUMBA_LINKING_LAZY'
 
 random_name_substr_len = 20
 
@@ -26,6 +55,7 @@ class FuncData(typing.NamedTuple):
     func_p: int
     func_py: types.FunctionType
     ns: dict
+    func_attrs: frozenset = frozenset()
 
 
 def check_and_populate_ns(name, obj, ns):
@@ -56,24 +86,274 @@ def extract_py_func(func):
         raise ValueError(f"Unsupported {func} of type {type(func)}")
 
 
-def get_func_data(func, sig, jit_options=None):
+def get_func_name(func_py):
+    return f"{func_py.__name__}{BIND_JIT_SFX}"
+
+
+def has_overload(dispatcher, sig):
+    cres = dispatcher.overloads.get(sig.args)
+    return cres is not None and cres.signature.return_type == sig.return_type
+
+
+def has_jit_options(dispatcher, jit_options):
+    """ Whether `dispatcher` compiles with `jit_options`, `cache` included, which is not one of its target options """
+    options = dict(jit_options)
+    if bool(options.pop('cache', False)) == isinstance(dispatcher._cache, NullCache):
+        return False
+    return all(dispatcher.targetoptions.get(key) == value for key, value in options.items())
+
+
+def get_compiled_dispatcher(func, sigs, jit_options=None):
+    """
+    `func` if it is a dispatcher that already compiled every signature in `sigs`, to reuse its overloads,
+    and `jit_options` are either empty or the ones it compiles with, see `has_jit_options`
+    """
+    if not isinstance(func, numba.core.registry.CPUDispatcher) or not sigs:
+        return None
+    if jit_options and not has_jit_options(func, jit_options):
+        return None
+    return func if all(has_overload(func, sig) for sig in sigs) else None
+
+
+def is_compiled_cfunc(func, sig):
+    return isinstance(func, numba.core.ccallback.CFunc) and func._sig == sig and func.address is not None
+
+
+def jit_func_in_ns(func, sig, jit_options=None, jit_func=None):
+    """ Puts `jit_func`, or else a new njit of `func` compiled for `sig`, in the namespace of `func` """
     jit_options = {} if jit_options is None else jit_options
     func_py = extract_py_func(func)
-    func_name = f"{func_py.__name__}{BIND_JIT_SFX}"
+    func_name = get_func_name(func_py)
     func_args = inspect.getfullargspec(func_py).args
     func_args_str = ', '.join(func_args)
-    func_jit_str = f"{func_name}{JIT_SFX} = numba.njit({func_name}{SIG_SFX}, **{func_name}{JIT_OPTS_SFX})({func_name}{PY_SFX})"  # noqa: E501
-    func_jit_code = compile(func_jit_str, inspect.getfile(func_py), mode='exec')
     ns = populate_ns(func_py, func_name, sig, jit_options)
-    exec(func_jit_code, ns)
-    func_p = _get_wrapper_address(ns[f'{func_name}{JIT_SFX}'], sig)
-    return FuncData(func_name, func_args_str, func_p, func_py, ns)
+    if jit_func is None:
+        func_jit_str = f"{func_name}{JIT_SFX} = numba.njit({func_name}{SIG_SFX}, **{func_name}{JIT_OPTS_SFX})({func_name}{PY_SFX})"  # noqa: E501
+        func_jit_code = compile(func_jit_str, inspect.getfile(func_py), mode='exec')
+        with timed(CALLEE, func_name):
+            exec(func_jit_code, ns)
+    else:
+        ns[f'{func_name}{JIT_SFX}'] = jit_func
+    return FuncData(func_name, func_args_str, None, func_py, ns)
+
+
+def get_func_data(func, sig, jit_options=None):
+    """
+    Reuses the overload of `func` for `sig` if `func` is a dispatcher that compiled it,
+    or the address of `func` if it is a cfunc of signature `sig`, and compiles an njit of its Python function otherwise.
+    """
+    if is_compiled_cfunc(func, sig):
+        # compiled only if needed, e.g. by `registry.get_compile_result`
+        jit_func = numba.njit(**(jit_options or {}))(func._pyfunc)
+        func_data = jit_func_in_ns(func, sig, jit_options, jit_func)
+        func_p = func.address
+        func_attrs = infer_cfunc_object_attributes(func)
+    else:
+        func_data = jit_func_in_ns(func, sig, jit_options, get_compiled_dispatcher(func, [sig], jit_options))
+        jit_func = func_data.ns[f'{func_data.func_name}{JIT_SFX}']
+        with timed(WRAPPER_ADDRESS, func_data.func_name):
+            func_p = _get_wrapper_address(jit_func, sig)
+        func_attrs = infer_attributes(jit_func.overloads[sig.args])
+    check_and_populate_ns(f'{func_data.func_name}{ATTRS_SFX}', func_attrs, func_data.ns)
+    return func_data._replace(func_p=func_p, func_attrs=func_attrs)
+
+
+def record_func_data(func, func_data, sig):
+    """ Describes the code of a function bound by `get_func_data` to `perf`, see `perf.record_library` """
+    if is_compiled_cfunc(func, sig):
+        record_library(func._library, func_data.func_name, func._wrapper_name, sig)
+    else:
+        jit_func = func_data.ns[f'{func_data.func_name}{JIT_SFX}']
+        record_compile_result(func_data.func_name, sig, jit_func.overloads[sig.args])
+
+
+def get_symbol_name(func_py, sig):
+    """ Symbol of one specialization of a multi-signature `bind_jit` function, e.g. `calculation_dd_BIND_JIT_SFX` """
+    return f"{func_py.__name__}_{mangle_args(sig.args)}{BIND_JIT_SFX}"
+
+
+class SymbolSelector:
+    """
+    Maps argument types seen at typing time to the signature and the symbol of the matching specialization.
+    With `sigs=None` the callee is compiled the first time new argument types are seen.
+    A symbol is compiled and added with `ll.add_symbol` by `link`, which the intrinsic `codegen` calls,
+    and `registry.resolve_symbol` before a caller declaring it is loaded from cache, see `dependencies.rebuild_linked`.
+    With `abi='native'` the symbol is the callee's Numba-ABI function rather than its cfunc wrapper.
+    With `instrument` set, callers count their calls of each symbol, see `instrument.count_call`.
+    With `swappable` set, callers load the address of a symbol from its slot, see `swap.load_slot`,
+    so that `rebind` can replace the implementation without recompiling them.
+    With `inline_budget` set, a specialization whose function has at most `inline_budget` LLVM instructions
+    is linked into its callers, which call its Numba-ABI function so LLVM can inline it, see `inlined`.
+    With a `multiversion.Variant` as `variant`, the symbols are compiled for that target, see `multiversion`.
+    With `vector_widths` set, the symbols of signatures of numbers also get variants taking vectors of each width,
+    which callers name at their calls so that loops calling them can be vectorized, see `vector_variants`.
+    """
+    def __init__(self, func_data, sigs, abi=C_ABI, instrument=None, swappable=False, jit_options=None,
+                 inline_budget=None, variant=None, vector_widths=()):
+        self.func_data = func_data
+        self.sigs = sigs
+        self.jit_options = {} if jit_options is None else jit_options
+        self.abi = abi
+        self.instrument = instrument
+        self.swappable = swappable
+        self.inline_budget = inline_budget
+        self.variant = variant
+        self.vector_widths = vector_widths
+        self.impl = None if variant is None else make_variant_dispatcher(func_data.func_py, variant, self.jit_options)
+        self.symbols = {}
+        self.linked = set()
+        self.attributes = {}
+        self.inlined = {}
+        self.vector_libraries = {}
+        if sigs is None:
+            register_specializer(func_data.func_py.__name__, self.specialize_sig)
+        register_function(func_data.func_name, self)
+
+    @property
+    def jit_func(self):
+        return self.func_data.ns[f'{self.func_data.func_name}{JIT_SFX}']
+
+    @property
+    def impl_func(self):
+        """ Dispatcher the symbols are compiled from, the one passed to the last `rebind` if any """
+        return self.jit_func if self.impl is None else self.impl
+
+    def add_signature(self, sig, symbol=None):
+        symbol = get_symbol_name(self.func_data.func_py, sig) if symbol is None else symbol
+        self.symbols[sig.args] = sig, symbol
+        register_symbol(symbol, sig, self.abi, self.impl_func, functools.partial(self.link, sig))
+        if self.instrument:
+            register_counter(symbol)
+
+    def link(self, sig):
+        sig, symbol = self.symbols[sig.args]
+        if symbol not in self.linked:
+            aot_symbol = lookup_symbol(symbol, sig, self.abi, self.func_data.func_py) if self.impl is None else None
+            if aot_symbol is None:
+                address = self.compile(sig)
+                cres = self.impl_func.overloads[sig.args]
+                attrs = infer_attributes(cres, self.abi == NATIVE_ABI)
+                if self.inline_budget is not None and self.is_small(cres):
+                    self.inlined[symbol] = cres
+                elif self.vector_widths and is_vectorizable(sig):
+                    with timed(CALLEE, symbol):
+                        self.vector_libraries[symbol] = add_vector_variants(cres, symbol, self.vector_widths)
+            else:
+                address, attrs = aot_symbol.address, aot_symbol.attrs
+            self.bind(symbol, address)
+            # a later implementation may not have the attributes of this one
+            self.attributes[symbol] = frozenset() if self.swappable else attrs
+            register_attributes(symbol, self.attributes[symbol])
+            self.linked.add(symbol)
+
+    def is_small(self, cres):
+        return get_ir_size(cres.library, cres.fndesc.llvm_func_name) <= self.inline_budget
+
+    def compile(self, sig):
+        if sig.args not in self.impl_func.overloads:
+            with timed(CALLEE, self.symbols[sig.args][1]):
+                self.impl_func.compile(sig)
+        record_compile_result(self.symbols[sig.args][1], sig, self.impl_func.overloads[sig.args], self.abi == NATIVE_ABI)
+        return self.get_address(sig)
+
+    def bind(self, symbol, address):
+        ll.add_symbol(symbol, address)
+        if self.swappable:
+            set_slot(symbol, address)
+
+    def get_address(self, sig):
+        if self.abi == NATIVE_ABI:
+            cres = self.impl_func.overloads[sig.args]
+            return cres.library.get_pointer_to_function(cres.fndesc.llvm_func_name)
+        with timed(WRAPPER_ADDRESS, self.symbols[sig.args][1]):
+            return _get_wrapper_address(self.impl_func, sig)
+
+    def declare(self, context, builder, func_t, symbol):
+        """ Callee a caller's `codegen` calls for `symbol` """
+        if self.swappable:
+            return load_slot(builder, func_t, symbol)
+        cres = self.inlined.get(symbol)
+        if cres is not None:
+            context.add_linking_libs([cres.library])
+            # kept declared, so that the caches of callers record `symbol`, see `dependencies.get_dependencies`
+            add_compiler_used(builder.module, [cgutils.get_or_insert_function(builder.module, func_t, symbol)])
+            return cgutils.get_or_insert_function(builder.module, func_t, cres.fndesc.llvm_func_name)
+        func = cgutils.get_or_insert_function(builder.module, func_t, symbol)
+        set_function_attributes(func, self.attributes[symbol])
+        return func
+
+    def make_codegen(self, sig, symbol):
+        """
+        `codegen` of the intrinsic calling `symbol`, the specialization of signature `sig`.
+        Inlined specializations are called as Numba-ABI functions, the cfunc wrapper is never inlined.
+        """
+        def codegen(context, builder, signature, args):
+            self.link(sig)
+            native = self.abi == NATIVE_ABI or symbol in self.inlined
+            if native:
+                func_t = context.call_conv.get_function_type(sig.return_type, sig.args)
+            else:
+                func_t = ir.FunctionType(
+                    context.get_value_type(sig.return_type), [context.get_value_type(arg) for arg in sig.args]
+                )
+            func = self.declare(context, builder, func_t, symbol)
+            with count_call(builder, symbol, self.instrument):
+                if native:
+                    status, res = context.call_conv.call_function(builder, func, sig.return_type, sig.args, args)
+                else:
+                    res = builder.call(func, args)
+                    if symbol in self.vector_libraries:
+                        attach_vector_variants(context, builder, res, sig, self.vector_widths)
+            if native:
+                with cgutils.if_unlikely(builder, status.is_error):
+                    context.call_conv.return_status_propagate(builder, status)
+            return res
+        return codegen
+
+    def rebind(self, impl):
+        """ Compiles `impl` for the linked signatures and points their slots to it, later links also use it """
+        self.impl = impl
+        for sig, symbol in self.symbols.values():
+            register_symbol(symbol, sig, self.abi, impl, functools.partial(self.link, sig))
+            if symbol in self.linked:
+                self.bind(symbol, self.compile(sig))
+
+    def specialize(self, args):
+        self.jit_func.compile(args)
+        self.add_signature(self.jit_func.overloads[args].signature)
+
+    def specialize_sig(self, sig):
+        if sig.args not in self.symbols:
+            self.specialize(sig.args)
+
+    def get_cached_args(self):
+        """ Argument types the on-disk cache of the callee holds overloads for, e.g. specialized by earlier processes """
+        cache = self.jit_func._cache
+        if isinstance(cache, NullCache):
+            return []
+        return [sigutils.normalize_signature(key[0])[0] for key in cache._cache_file._load_index()]
+
+    def specialize_cached(self, symbol):
+        """ Specializes the callee for the cached argument types `symbol` is the specialization for, if any """
+        for args in self.get_cached_args():
+            if get_specialized_func_name(symbol, args) == self.func_data.func_py.__name__ and args not in self.symbols:
+                self.specialize(args)
+
+    def __call__(self, typingctx, *args):
+        args = tuple(numba.types.unliteral(arg) for arg in args)
+        if self.sigs is None:
+            if args not in self.symbols:
+                self.specialize(args)
+            return self.symbols[args]
+        sig = typingctx.resolve_overload(self.func_data.func_name, self.sigs, args, {})
+        return None if sig is None else self.symbols[sig.args]
 
 
 def populate_ns_imports(ns: typing.Dict):
     ns['intrinsic'] = intrinsic
     ns['ir'] = ir
     ns['cgutils'] = cgutils
+    ns['set_function_attributes'] = set_function_attributes
 
 
 func_sfx = '__'
@@ -89,6 +369,7 @@ def _{{func_name}}(typingctx, {{func_args_str}}):
             [context.get_value_type(arg) for arg in sig.args]
         )
         {{func_name}}_ = cgutils.get_or_insert_function(builder.module, func_t, "{{func_name}}")
+        set_function_attributes({{func_name}}_, {{func_name}}{ATTRS_SFX})
         return builder.call({{func_name}}_, args)
     return sig, codegen
 
@@ -98,23 +379,312 @@ def {{func_name}}{func_sfx}({{func_args_str}}):
 """
 
 
-def make_code_str(func_name, func_args_str):
-    return code_str_template.format(
+code_str_multi_template = f"""
+@intrinsic
+def _{{func_name}}(typingctx, {{func_args_str}}):
+    selected = {{func_name}}{SELECT_SFX}(typingctx, {{func_args_str}})
+    if selected is None:
+        return None
+    sig, symbol = selected
+    return sig, {{func_name}}{SELECT_SFX}.make_codegen(sig, symbol)
+
+@numba.njit({{func_name}}{SIG_SFX}, **{{func_name}}{JIT_OPTS_SFX})
+def {{func_name}}{func_sfx}({{func_args_str}}):
+    return _{{func_name}}({{func_args_str}})
+"""
+
+
+def make_code_str(func_name, func_args_str, template=code_str_template):
+    return template.format(
         func_name=func_name, func_args_str=func_args_str
     )
 
 
-def bind_jit(sig, **jit_options):
-    if not isinstance(sig, numba.core.typing.templates.Signature):
+def exec_code_str(func_data, template=code_str_template):
+    populate_ns_imports(func_data.ns)
+    code_str = make_code_str(func_data.func_name, func_data.func_args_str, template)
+    code_obj = compile(code_str, inspect.getfile(func_data.func_py), mode='exec')
+    register_wrapper(f"{func_data.func_name}{func_sfx}", func_data.func_name)
+    exec(code_obj, func_data.ns)
+    return func_data.ns[f"{func_data.func_name}{func_sfx}"]
+
+
+def make_intrinsic(name, arg_names, typer):
+    """ Intrinsic `name` of arguments `arg_names` typed by `typer(typingctx, *args)` """
+    typer.__name__ = typer.__qualname__ = name
+    # Numba takes the Python signature of an intrinsic from its typer, `*args` would make it expect a tuple
+    parameters = [inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD) for arg in ('typingctx', *arg_names)]
+    typer.__signature__ = inspect.Signature(parameters)
+    return intrinsic(typer)
+
+
+def make_selector_intrinsic(selector):
+    def typer(typingctx, *args):
+        selected = selector(typingctx, *args)
+        if selected is None:
+            return None
+        sig, symbol = selected
+        return sig, selector.make_codegen(sig, symbol)
+    func_data = selector.func_data
+    return make_intrinsic(f"_{func_data.func_name}", inspect.getfullargspec(func_data.func_py).args, typer)
+
+
+def make_wrapper(intrinsic_, name, module, jit_options):
+    """
+    Lazy njit wrapper `name` calling `intrinsic_`, compiled for the argument types it is first called with.
+    It is not cached on disk, its code is part of the cached callers.
+    """
+    def wrapper(*args):
+        return intrinsic_(*args)
+    register_wrapper(name, name[:-len(func_sfx)])
+    wrapper.__name__ = wrapper.__qualname__ = name
+    wrapper.__module__ = module
+    return numba.njit(**{key: value for key, value in jit_options.items() if key != 'cache'})(wrapper)
+
+
+def bind_func(func, sigs, symbols, lazy, options):
+    """ Decoration without generated source, for `bind_jit(namespace=False)` """
+    func_py = extract_py_func(func)
+    func_name = get_func_name(func_py)
+    jit_func = get_compiled_dispatcher(func, sigs, options.jit_options) or numba.njit(**options.jit_options)(func_py)
+    func_data = FuncData(func_name, None, None, func_py, {f'{func_name}{JIT_SFX}': jit_func})
+    selector = options.make_selector(func_data, sigs)
+    for symbol, sig_ in zip(symbols, sigs or []):
+        selector.add_signature(sig_, symbol)
+        if not lazy:
+            selector.link(sig_)
+    return make_wrapper(make_selector_intrinsic(selector), f"{func_name}{func_sfx}", func_py.__module__, options.jit_options)
+
+
+def bind_plain(func, sig, lazy, options):
+    """ Decoration of a single signature compiled and added at decoration, whose callers need no `SymbolSelector` """
+    func_data = get_func_data(func, sig, options.jit_options)
+    ll.add_symbol(func_data.func_name, func_data.func_p)
+    record_func_data(func, func_data, sig)
+    register_symbol(func_data.func_name, sig, options.abi, func_data.ns[f'{func_data.func_name}{JIT_SFX}'])
+    register_attributes(func_data.func_name, func_data.func_attrs)
+    return add_batch(func_data, exec_code_str(func_data), [sig], options.batch, lazy)
+
+
+def bind_selector(func, sigs, symbols, lazy, defer, options):
+    """ Decoration whose callers choose the symbol they call with a `SymbolSelector`, compiled at decoration unless `defer` """
+    # with a variant only Python calls use the njit function, it is compiled when they need it
+    eager_sigs = None if defer or options.variant is not None else sigs
+    compiled = get_compiled_dispatcher(func, sigs, options.jit_options)
+    func_data = jit_func_in_ns(func, eager_sigs, options.jit_options, compiled)
+    selector = options.make_selector(func_data, sigs)
+    for symbol, sig_ in zip(symbols, sigs or []):
+        selector.add_signature(sig_, symbol)
+        if not lazy:
+            selector.link(sig_)
+    check_and_populate_ns(f'{func_data.func_name}{SELECT_SFX}', selector, func_data.ns)
+    func_wrap = exec_code_str(func_data, code_str_multi_template)
+    return add_batch(func_data, func_wrap, sigs, options.batch, lazy)
+
+
+def make_batch(func_wrap, sigs, target, lazy):
+    """
+    Ufunc calling the wrapper, hence the bound symbol, per element of its broadcast array arguments.
+    It is compiled for `sigs` unless `lazy`, then for the types it is called with, as `numba.vectorize` does.
+    """
+    if lazy and target == 'cpu':
+        return numba.vectorize()(func_wrap.py_func)
+    return numba.vectorize(sigs or [], target=target)(func_wrap.py_func)
+
+
+class Batch:
+    """ Makes the ufunc of a `bind_jit(batch=...)` function the first time it is needed, which compiles the callee """
+    def __init__(self, func_wrap, sigs, target, lazy):
+        self.func_wrap = func_wrap
+        self.sigs = sigs
+        self.target = target
+        self.lazy = lazy
+
+    @functools.cached_property
+    def ufunc(self):
+        return make_batch(self.func_wrap, self.sigs, self.target, self.lazy)
+
+
+def add_batch(func_data, func_wrap, sigs, target, lazy):
+    if target is not None:
+        if target == 'parallel' and sigs is None:
+            raise ValueError("batch='parallel' needs the signatures")
+        check_and_populate_ns(f'{func_data.func_name}{BATCH_SFX}', Batch(func_wrap, sigs, target, lazy), func_data.ns)
+    return func_wrap
+
+
+def get_batch(func):
+    """ Ufunc of the `bind_jit(batch=...)` function `func`, e.g. `get_batch(calculation)(a, b)` """
+    func_py = func.py_func
+    return func_py.__globals__[f'{func_py.__name__[:-len(func_sfx)]}{BATCH_SFX}'].ufunc
+
+
+def is_signature(sig):
+    return isinstance(sig, numba.core.typing.templates.Signature)
+
+
+class BindOptions(typing.NamedTuple):
+    """ Options of `bind_jit`, checked by `get_bind_options` """
+    abi: str
+    instrument: typing.Optional[str]
+    swappable: bool
+    batch: typing.Optional[str]
+    inline_budget: typing.Optional[int]
+    variant: typing.Any
+    vector_widths: tuple
+    jit_options: dict
+
+    @property
+    def plain(self):
+        """ Whether a single signature can be bound without a `SymbolSelector` """
+        return (
+            self.abi == C_ABI and self.instrument is None and not self.swappable and self.inline_budget is None
+            and self.variant is None and not self.vector_widths
+        )
+
+    def make_selector(self, func_data, sigs):
+        return SymbolSelector(
+            func_data, sigs, self.abi, self.instrument, self.swappable, self.jit_options,
+            self.inline_budget, self.variant, self.vector_widths
+        )
+
+
+def check_sig(sig):
+    """ `sig` as a list if it is a sequence of signatures, raises if it is neither that, nor a signature, nor None """
+    if isinstance(sig, (list, tuple)):
+        for sig_ in sig:
+            if not is_signature(sig_):
+                raise ValueError(f"Expected signature, got {sig_}")
+        return list(sig)
+    if sig is not None and not is_signature(sig):
         raise ValueError(f"Expected signature, got {sig}")
+    return sig
+
+
+def get_instrument_mode(instrument):
+    instrument = CALLS if instrument is True else instrument or None
+    if instrument is not None and instrument not in INSTRUMENT_MODES:
+        raise ValueError(f"Expected instrument to be one of {INSTRUMENT_MODES}, got {instrument!r}")
+    return instrument
+
+
+def get_batch_target(batch, namespace):
+    batch = BATCH_TARGETS[0] if batch is True else batch or None
+    if batch is not None and batch not in BATCH_TARGETS:
+        raise ValueError(f"Expected batch to be one of {BATCH_TARGETS}, got {batch!r}")
+    if batch is not None and not namespace:
+        raise ValueError("batch needs namespace=True, the wrapper of namespace=False takes *args")
+    return batch
+
+
+def get_inline_budget(inline_budget, swappable, jit_options):
+    """ `inline_budget` and `jit_options` without `inline` with `inline='auto'`, None and `jit_options` otherwise """
+    if jit_options.get('inline') != INLINE_AUTO:
+        return None, jit_options
+    if swappable:
+        raise ValueError("inline='auto' needs swappable=False, inlined callers could not be rebound")
+    return inline_budget, {key: value for key, value in jit_options.items() if key != 'inline'}
+
+
+def get_vector_widths(vectorize, abi, swappable, variant):
+    vector_widths = VECTOR_WIDTHS if vectorize is True else tuple(vectorize or ())
+    if any(width < 2 or width & (width - 1) for width in vector_widths):
+        raise ValueError(f"Expected vector widths to be powers of 2 from 2, got {vector_widths}")
+    if vector_widths and (abi != C_ABI or swappable or variant is not None):
+        raise ValueError("vectorize needs abi='c', swappable=False and multiversion=None, callers call the variants directly")
+    return vector_widths
+
+
+def get_bind_options(abi, instrument, swappable, namespace, batch, inline_budget, multiversion, vectorize, jit_options):
+    """ `BindOptions` of the arguments of `bind_jit`, raises `ValueError` for invalid or incompatible ones """
+    if abi not in (C_ABI, NATIVE_ABI):
+        raise ValueError(f"Expected abi to be one of {C_ABI!r}, {NATIVE_ABI!r}, got {abi!r}")
+    inline_budget, jit_options = get_inline_budget(inline_budget, swappable, jit_options)
+    variant = None if not multiversion else select_variant(None if multiversion is True else multiversion)
+    if variant is not None and inline_budget is not None:
+        raise ValueError("inline='auto' needs multiversion=None, variants cannot be linked into their callers")
+    return BindOptions(
+        abi, get_instrument_mode(instrument), swappable, get_batch_target(batch, namespace), inline_budget, variant,
+        get_vector_widths(vectorize, abi, swappable, variant), jit_options
+    )
+
+
+def bind_jit(sig=None, lazy=None, abi=C_ABI, instrument=None, swappable=False, namespace=True, batch=None,
+             inline_budget=INLINE_BUDGET, multiversion=None, vectorize=None, **jit_options):
+    """
+    `sig` is either a single signature, bound under the `{func_name}_BIND_JIT_SFX` symbol,
+    or a list of signatures, each bound under its own mangled symbol (see `get_symbol_name`),
+    or None, in which case a specialization is compiled and bound the first time it is typed,
+    or, with `cache=True`, when a caller loaded from cache declares it (see `resolve_specialization`);
+    callers of one not cached are compiled again by each process.
+    With `lazy=True` nothing is compiled at decoration, a symbol is compiled and added the first time
+    a caller's intrinsic `codegen` needs it, a caller declaring it is loaded from cache, or its wrapper is called from Python.
+    `lazy=None` defers to the `NUMBA_LINKING_LAZY` environment variable.
+    With `abi='native'` callers call the callee's Numba-ABI function directly, skipping the cfunc wrapper,
+    and exceptions raised in the callee propagate to the caller.
+    With `instrument='calls'`, or `True`, callers count their calls in `instrument.counters`,
+    with `instrument='cycles'` they also accumulate the cycles spent in the callee.
+    Symbols found in a library loaded with `aot.load_shared_library` are registered from it instead of compiled.
+    With `swappable=True` callers call through a slot holding the address of the callee, see `rebind`.
+    With `namespace=False` no source is generated and nothing is added to the defining module,
+    the callee and its bookkeeping are kept in `registry.bound_functions`, and the returned wrapper is compiled lazily,
+    which keeps decoration cheap for programmatically generated functions.
+    With `batch='cpu'`, or `True`, or `batch='parallel'`, a ufunc applying the bound function to arrays
+    is added next to it, see `get_batch`.
+    With `inline='auto'` each specialization of at most `inline_budget` LLVM instructions is linked into its callers,
+    where LLVM can inline it and exceptions it raises propagate as with `abi='native'`,
+    and the others are called through their symbols.
+    Other values of `inline` are passed to `numba.njit` like the other `jit_options`.
+    With `multiversion=True`, or a sequence of `multiversion.Variant`, the symbols are compiled for the best variant
+    the running CPU supports, e.g. with AVX-512 while callers and their caches target `NUMBA_CPU_NAME=generic`;
+    the callee must not call other njit functions, which are compiled for Numba's own target.
+    With `vectorize=True`, or a sequence of vector widths, each symbol whose arguments and result are numbers
+    also gets variants taking and returning vectors of 2, 4 and 8, or of the given, lanes,
+    and loops of callers calling it can be vectorized by LLVM, which calls a variant on as many elements at once.
+    The variants drop the exceptions the callee raises, as its cfunc wrapper does.
+    """
+    sig = check_sig(sig)
+    options = get_bind_options(
+        abi, instrument, swappable, namespace, batch, inline_budget, multiversion, vectorize, jit_options
+    )
 
     def wrap(func):
-        func_data = get_func_data(func, sig, jit_options)
-        ll.add_symbol(func_data.func_name, func_data.func_p)
-        populate_ns_imports(func_data.ns)
-        code_str = make_code_str(func_data.func_name, func_data.func_args_str)
-        code_obj = compile(code_str, inspect.getfile(func_data.func_py), mode='exec')
-        exec(code_obj, func_data.ns)
-        func_wrap = func_data.ns[f"{func_data.func_name}{func_sfx}"]
-        return func_wrap
+        lazy_ = os.environ.get(LAZY_ENV, '0') == '1' if lazy is None else lazy
+        func_py = extract_py_func(func)
+        sigs = [sig] if is_signature(sig) else sig
+        symbols = [get_func_name(func_py)] if is_signature(sig) else [get_symbol_name(func_py, sig_) for sig_ in sigs or []]
+        if not namespace:
+            return bind_func(func, sigs, symbols, lazy_, options)
+        defer = lazy_ or any(lookup_symbol(symbol, sig_, abi, func_py) for symbol, sig_ in zip(symbols, sigs or []))
+        if is_signature(sig) and not defer and options.plain:
+            return bind_plain(func, sig, lazy_, options)
+        return bind_selector(func, sigs, symbols, lazy_, defer, options)
     return wrap
+
+
+def resolve_specialization(symbol):
+    """
+    Resolver of the symbols of `bind_jit(sig=None)` functions specialized in an earlier process,
+    which callers loaded from cache declare without typing them, see `SymbolSelector.specialize_cached`
+    """
+    for selector in list(bound_functions.values()):
+        if selector.sigs is None and symbol.startswith(f"{selector.func_data.func_py.__name__}_"):
+            selector.specialize_cached(symbol)
+
+
+def rebind(func, new_func):
+    """
+    Replaces the implementation of the `swappable` `bind_jit` function `func` with `new_func`,
+    compiled with the same options; compiled callers, including ones loaded from cache, call `new_func` from then on.
+    """
+    selector = bound_functions.get(func.py_func.__name__[:-len(func_sfx)])
+    if selector is None or not selector.swappable:
+        raise ValueError(f"Expected a bind_jit function with swappable=True, got {func}")
+    if not isinstance(new_func, numba.core.registry.CPUDispatcher):
+        new_func = numba.njit(**selector.jit_options)(extract_py_func(new_func))
+    selector.rebind(new_func)
+
+
+load_env_libraries()
+enable_cache_linking()
+add_resolver(resolve_specialization)
@@ -0,0 +1,114 @@
+import llvmlite.binding as ll
+import numba
+import os
+from llvmlite import ir
+from numba.core import cgutils
+from numba.core.compiler_lock import global_compiler_lock
+from numba.core.registry import cpu_target
+
+from numba_linking.bind_jit import func_sfx, is_signature, make_intrinsic, make_wrapper
+from numba_linking.infer_attrs import get_library_module, get_llvm_attributes, set_function_attributes
+from numba_linking.orc import get_orc_linker
+from numba_linking.perf import record_library
+
+
+STATIC = 'static'
+SEPARATE = 'separate'
+ORC = 'orc'
+LINK_MODES = (STATIC, SEPARATE, ORC)
+
+BITCODE_EXT = '.bc'
+
+
+def parse_module(ir_or_bc):
+    """ LLVM module from IR text, bitcode bytes, or the path of a `.ll` or `.bc` file """
+    if isinstance(ir_or_bc, bytes):
+        return ll.parse_bitcode(ir_or_bc)
+    if os.path.isfile(ir_or_bc):
+        if ir_or_bc.endswith(BITCODE_EXT):
+            with open(ir_or_bc, 'rb') as f:
+                return ll.parse_bitcode(f.read())
+        with open(ir_or_bc) as f:
+            ir_or_bc = f.read()
+    return ll.parse_assembly(ir_or_bc)
+
+
+@global_compiler_lock
+def make_library(module, symbol):
+    """ Numba code library of `module`, optimized with the host target like the libraries of jitted functions """
+    codegen = cpu_target.target_context.codegen()
+    module.triple = ll.get_process_triple()
+    module.data_layout = str(codegen.target_data)
+    func = module.get_function(symbol)
+    func.linkage = ll.Linkage.external
+    module.verify()
+    library = codegen.create_library(f"bind_llvm.{symbol}")
+    library.add_llvm_module(module)
+    library.finalize()
+    return library
+
+
+def bind_llvm(ir_or_bc, symbol, sig, link=STATIC, **jit_options):
+    """
+    Makes the function `symbol` of an LLVM module, given as in `parse_module`, callable from njit code as `sig`,
+    through an njit wrapper, like `bind_jit` functions. Arguments and result are passed as Numba's value types.
+    With `link='static'` the module is linked into each caller, where LLVM can inline `symbol`,
+    with `link='separate'` it is compiled once and callers call `symbol` by address,
+    with `link='orc'` it is added to the session of `orc.get_orc_linker` and compiled when a caller is first compiled,
+    symbols it declares that other `link='orc'` modules define are resolved by the session.
+    `bind_jit` callees are not in that session, they stay in the engine of Numba's code generator.
+    """
+    if link not in LINK_MODES:
+        raise ValueError(f"Expected link to be one of {LINK_MODES}, got {link!r}")
+    if not is_signature(sig):
+        raise ValueError(f"Expected signature, got {sig}")
+    if link == ORC:
+        return bind_orc(parse_module(ir_or_bc), symbol, sig, jit_options)
+    library = make_library(parse_module(ir_or_bc), symbol)
+    attrs = get_llvm_attributes(get_library_module(library).get_function(symbol))
+    if link == SEPARATE:
+        ll.add_symbol(symbol, library.get_pointer_to_function(symbol))
+        record_library(library, symbol, symbol, sig)
+
+    def prepare(context):
+        if link == STATIC:
+            context.add_linking_libs([library])
+        return attrs
+    return bind_symbol(symbol, sig, prepare, jit_options)
+
+
+def bind_orc(module, symbol, sig, jit_options):
+    linker = get_orc_linker()
+    module.get_function(symbol).linkage = ll.Linkage.external
+    linker.add_module(linker.prepare_module(module), f"bind_llvm.{symbol}")
+    attrs = get_llvm_attributes(module.get_function(symbol))
+
+    def prepare(context):
+        # also when the symbol was looked up in the session before, which does not add it for Numba's engine
+        ll.add_symbol(symbol, linker.get_address(symbol))
+        return attrs
+    return bind_symbol(symbol, sig, prepare, jit_options)
+
+
+def bind_symbol(symbol, sig, prepare, jit_options):
+    """
+    njit wrapper of an intrinsic calling the C-ABI function `symbol` of signature `sig`,
+    `prepare(context)` makes `symbol` available to the caller and returns the attributes of its declaration.
+    """
+    def codegen(context, builder, signature, args):
+        attrs = prepare(context)
+        func_t = ir.FunctionType(
+            context.get_value_type(sig.return_type), [context.get_value_type(arg) for arg in sig.args]
+        )
+        func = cgutils.get_or_insert_function(builder.module, func_t, symbol)
+        set_function_attributes(func, attrs)
+        return builder.call(func, args)
+
+    def typer(typingctx, *args):
+        args = tuple(numba.types.unliteral(arg) for arg in args)
+        if typingctx.resolve_overload(symbol, [sig], args, {}) is None:
+            return None
+        return sig, codegen
+
+    arg_names = [f'arg{i}' for i in range(len(sig.args))]
+    return make_wrapper(make_intrinsic(f"_{symbol}", arg_names, typer), f"{symbol}{func_sfx}", __name__, jit_options)
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import llvmlite.binding as ll
+import numba
+import os
+import re
+import tempfile
+from numba.core import sigutils
+from numba.core.caching import CompileResultCacheImpl, FunctionCache
+
+from numba_linking.infer_attrs import get_library_module
+from numba_linking.registry import BIND_JIT_SFX, bound_symbols, get_code_hash, get_sig_str, resolve_symbol, symbol_attributes
+from numba_linking.swap import SLOT_SFX
+from numba_linking.vector_variants import VECTOR_SFX
+
+
+DEPS_EXT = '.nbd'
+
+# a declared bound symbol, its slot or one of its vector variants
+bound_name_re = re.compile(f"(.*{BIND_JIT_SFX})({SLOT_SFX}|{VECTOR_SFX}[0-9]+)?")
+
+rebuild_overload = CompileResultCacheImpl.rebuild
+
+
+def get_symbol_hash(bound_symbol):
+    """
+    Hash of what callers bake in of `bound_symbol`: its signature and ABI, the attributes of its declaration,
+    and the bytecode of its implementation, which inlined callees are copies of
+    """
+    attrs = ','.join(sorted(symbol_attributes.get(bound_symbol.symbol, ())))
+    code_hash = get_code_hash(bound_symbol.jit_func.py_func)
+    return hashlib.sha256(f"{bound_symbol.abi}:{bound_symbol.sig}:{attrs}:{code_hash}".encode()).hexdigest()[:16]
+
+
+def get_declared_names(module):
+    names = [func.name for func in module.functions if func.is_declaration]
+    names += [gv.name for gv in module.global_variables if gv.is_declaration]
+    return [name[:-len(SLOT_SFX)] if name.endswith(SLOT_SFX) else name for name in names]
+
+
+def get_dependency(bound_symbol):
+    return dict(
+        hash=get_symbol_hash(bound_symbol), module=bound_symbol.module, sig=get_sig_str(bound_symbol.sig)
+    )
+
+
+def get_dependencies(library):
+    """
+    Bound symbols the code of `library` declares, inlined ones included, which callers keep declared,
+    with the hashes of their signatures and where to find them
+    """
+    names = get_declared_names(get_library_module(library))
+    return {name: get_dependency(bound_symbols[name]) for name in names if name in bound_symbols}
+
+
+def get_stale_symbols(dependencies):
+    """ Symbols in `dependencies` that are not bound anymore, or bound with another signature or ABI """
+    return [
+        symbol for symbol, dependency in dependencies.items()
+        if symbol not in bound_symbols or get_symbol_hash(bound_symbols[symbol]) != dependency['hash']
+    ]
+
+
+def resolve_dependencies(dependencies):
+    for symbol, dependency in dependencies.items():
+        resolve_symbol(symbol, dependency['module'], dependency['sig'])
+
+
+class DependencyCache(FunctionCache):
+    """
+    Records the bound symbols each cached overload depends on in a `.nbd` file next to its index.
+    Before loading an overload its symbols are resolved, see `registry.resolve_symbol`,
+    so only the callees a process reaches are imported and compiled.
+    A cached overload is ignored, then compiled and saved again, if any of them is stale.
+    """
+    @property
+    def deps_path(self):
+        return os.path.join(self._cache_path, f"{self._impl.filename_base}{DEPS_EXT}")
+
+    def load_dependencies(self):
+        """ Dependencies of the cached overloads by key, None if they cannot be read """
+        try:
+            with open(self.deps_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def get_key(sig):
+        args, _ = sigutils.normalize_signature(sig)
+        return str(args)
+
+    def load_overload(self, sig, target_context):
+        # an overload whose dependencies were not recorded may call stale symbols
+        dependencies = (self.load_dependencies() or {}).get(self.get_key(sig))
+        if dependencies is None:
+            return None
+        resolve_dependencies(dependencies)
+        if get_stale_symbols(dependencies):
+            return None
+        return super().load_overload(sig, target_context)
+
+    def save_overload(self, sig, data):
+        super().save_overload(sig, data)
+        if not self._enabled or not self._impl.check_cachable(data) or not os.path.isdir(self._cache_path):
+            return
+        dependencies = self.load_dependencies() or {}
+        dependencies[self.get_key(sig)] = get_dependencies(data.library)
+        # written aside and renamed, readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_path, suffix=DEPS_EXT)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(dependencies, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.deps_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def get_serialized_module(libdata):
+    """ LLVM module of the code library serialized as `libdata`, see `CodeLibrary.serialize_using_object_code` """
+    _, kind, data = libdata
+    return ll.parse_bitcode(data[1] if kind == 'object' else data)
+
+
+def link_declared_symbols(libdata):
+    """
+    Links the bound symbols the serialized code library `libdata` declares, see `registry.resolve_symbol`,
+    returns whether the linker has all of them
+    """
+    _, kind, data = libdata
+    # the names of a bitcode module are in its string table, most libraries declare no bound symbol
+    if BIND_JIT_SFX.encode() not in (data[1] if kind == 'object' else data):
+        return True
+    module = get_serialized_module(libdata)
+    names = [func.name for func in module.functions if func.is_declaration]
+    names += [gv.name for gv in module.global_variables if gv.is_declaration]
+    matches = [match for match in map(bound_name_re.fullmatch, names) if match is not None]
+    for symbol in {match.group(1) for match in matches}:
+        resolve_symbol(symbol)
+    return all(ll.address_of_symbol(match.group(0)) is not None for match in matches)
+
+
+def rebuild_linked(self, target_context, payload):
+    """
+    `CompileResultCacheImpl.rebuild` of a cached overload of any dispatcher, which first links the bound symbols it declares,
+    as the intrinsic `codegen` of a compiled caller does; None, a cache miss that compiles the overload, if it cannot
+    """
+    if not link_declared_symbols(payload[0]):
+        return None
+    return rebuild_overload(self, target_context, payload)
+
+
+def enable_cache_linking():
+    """
+    Makes Numba link the bound symbols each overload it loads from cache declares, see `rebuild_linked`,
+    also for plain `numba.njit(cache=True)` callers of lazy or specialized-when-typed `bind_jit` functions
+    """
+    CompileResultCacheImpl.rebuild = rebuild_linked
+
+
+def enable_dependency_checks(dispatcher):
+    """
+    Makes the on-disk cache of `dispatcher` check the bound symbols it calls,
+    `dispatcher` must not have compiled anything yet, i.e. it was created without signatures.
+    """
+    dispatcher._cache = DependencyCache(dispatcher.py_func)
+    return dispatcher
+
+
+def checked_njit(sig=None, **jit_options):
+    """ `numba.njit` for callers of `bind_jit` functions, with `cache=True` the cache checks the bound symbols """
+    sigs = [sig] if isinstance(sig, numba.core.typing.templates.Signature) else sig or []
+
+    def wrap(func):
+        dispatcher = numba.njit(**jit_options)(func)
+        if jit_options.get('cache'):
+            enable_dependency_checks(dispatcher)
+        for sig_ in sigs:
+            dispatcher.compile(sig_)
+        if sigs:
+            dispatcher.disable_compile()
+        return dispatcher
+    return wrap
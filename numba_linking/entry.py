@@ -0,0 +1,32 @@
+import inspect
+import numba
+import typing
+
+
+entry_points: typing.Dict[tuple, typing.Any] = {}
+
+
+def get_entry_point(func, sig=None, nogil=True):
+    """
+    Compiled CPython entry of the `bind_jit` wrapper `func` for `sig`, which unboxes its arguments for `sig`
+    instead of typing them and looking up an overload as the dispatcher does.
+    With `nogil` it releases the GIL around the call of the bound symbol, so threads can call it concurrently.
+    `sig` can be left out when `func` has a single compiled signature.
+    """
+    if inspect.getfullargspec(func.py_func).varargs is not None:
+        raise ValueError(f"Expected a wrapper with named arguments, from bind_jit(namespace=True), got {func}")
+    if sig is None:
+        if len(func.signatures) != 1:
+            raise ValueError(f"Expected a signature for {func}, compiled for {func.signatures}")
+        args = func.signatures[0]
+    else:
+        args = sig.args
+    key = func, args, nogil
+    if key not in entry_points:
+        if args in func.overloads and func.targetoptions.get('nogil', False) == nogil:
+            dispatcher = func
+        else:
+            dispatcher = numba.njit(nogil=nogil)(func.py_func)
+            dispatcher.compile(args)
+        entry_points[key] = dispatcher.overloads[args].entry_point
+    return entry_points[key]
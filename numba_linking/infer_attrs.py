@@ -0,0 +1,149 @@
+import llvmlite.binding as ll
+from llvmlite import ir
+
+
+SAFE_ATTRS = frozenset([
+    'argmemonly', 'nofree', 'nosync', 'nounwind', 'readnone', 'readonly', 'willreturn', 'writeonly'
+])
+MEMORY_ATTRS = frozenset(['argmemonly', 'readnone', 'readonly', 'writeonly'])
+
+POINTER_OPS = ('bitcast', 'getelementptr')
+UNKNOWN_MEMORY_OPS = ('atomicrmw', 'cmpxchg', 'fence', 'invoke', 'va_arg')
+
+LOCAL = 'local'
+
+CFUNC_WRAPPER_PREFIX = 'cfunc.'
+
+
+class DeclarationAttributes(ir.FunctionAttributes):
+    """ `ir.FunctionAttributes` that also accepts the attributes LLVM infers but llvmlite does not list """
+    _known = ir.FunctionAttributes._known | SAFE_ATTRS
+
+
+def get_library_module(library):
+    """ Optimized module of a Numba code library, also when the library was loaded from cache as object code """
+    return library._get_module_for_linking()
+
+
+def get_object_code(library):
+    """
+    Object code of a finalized Numba code library. The engine takes the object code of a library loaded from cache,
+    and keeps none of a library without object caching, e.g. of `bind_llvm`; theirs is emitted again from their module.
+    """
+    obj = getattr(library, '_compiled_object', None)
+    if obj is None:
+        obj = library.codegen._tm.emit_object(get_library_module(library))
+    return obj
+
+
+def get_function_size(func):
+    return sum(len(list(block.instructions)) for block in func.blocks)
+
+
+def get_ir_size(library, name=None):
+    """ Number of LLVM instructions in the optimized module of `library`, or in its function `name` """
+    module = get_library_module(library)
+    if name is not None:
+        return get_function_size(module.get_function(name))
+    return sum(get_function_size(func) for func in module.functions if not func.is_declaration)
+
+
+def set_function_attributes(func, attrs):
+    func.attributes = DeclarationAttributes(set(func.attributes) | set(attrs))
+
+
+def get_llvm_attributes(func):
+    """ Attributes LLVM inferred for `func`, restricted to the ones safe to copy onto a declaration """
+    attrs = set()
+    for attr in func.attributes:
+        attrs.update(attr.decode().split())
+    return attrs & SAFE_ATTRS
+
+
+def get_pointer_base(value, defs):
+    """ Argument name, `LOCAL` for an alloca, or None if the pointer is derived from anything else """
+    while value.value_kind == ll.ValueKind.instruction:
+        inst = defs.get(value.name)
+        if inst is None:
+            return None
+        if inst.opcode == 'alloca':
+            return LOCAL
+        if inst.opcode not in POINTER_OPS:
+            return None
+        value = next(iter(inst.operands))
+    if value.value_kind == ll.ValueKind.argument:
+        return value.name
+    return None
+
+
+def get_memory_effects(func):
+    """
+    Sets of argument names `func` reads from and writes to, `None` standing for any other memory,
+    or None if `func` contains an operation with unknown memory effects.
+    """
+    instructions = [inst for block in func.blocks for inst in block.instructions]
+    defs = {inst.name: inst for inst in instructions if inst.name}
+    reads, writes = set(), set()
+    for inst in instructions:
+        operands = list(inst.operands)
+        if inst.opcode == 'load':
+            reads.add(get_pointer_base(operands[0], defs))
+        elif inst.opcode == 'store':
+            writes.add(get_pointer_base(operands[1], defs))
+        elif inst.opcode == 'call':
+            callee = operands[-1]
+            if callee.value_kind != ll.ValueKind.function:
+                return None
+            if 'readnone' not in get_llvm_attributes(func.module.get_function(callee.name)):
+                return None
+        elif inst.opcode in UNKNOWN_MEMORY_OPS:
+            return None
+    reads.discard(LOCAL)
+    writes.discard(LOCAL)
+    return reads, writes
+
+
+def with_memory_attr(attrs, memory_attr):
+    return (attrs - MEMORY_ATTRS) | {memory_attr}
+
+
+def infer_native_attributes(library, func_name):
+    """ Attributes of the Numba-ABI function `func_name`, adding `argmemonly` when it only accesses its arguments """
+    func = get_library_module(library).get_function(func_name)
+    attrs = get_llvm_attributes(func)
+    effects = get_memory_effects(func)
+    if effects is not None and None not in effects[0] | effects[1] and 'readnone' not in attrs:
+        attrs.add('argmemonly')
+    return attrs
+
+
+def infer_cfunc_attributes(library, func_name, cfunc_wrapper_name):
+    """
+    Attributes of the cfunc wrapper of the Numba-ABI function `func_name`.
+    The wrapper passes its own alloca as `retptr`, so writes to `retptr` are not visible to callers of the wrapper.
+    """
+    module = get_library_module(library)
+    wrapper_attrs = get_llvm_attributes(module.get_function(cfunc_wrapper_name))
+    func = module.get_function(func_name)
+    effects = get_memory_effects(func)
+    if effects is None:
+        return wrapper_attrs
+    reads, writes = effects
+    retptr = next(iter(func.arguments)).name
+    if writes - {retptr}:
+        return wrapper_attrs
+    return with_memory_attr(wrapper_attrs, 'readonly' if reads else 'readnone')
+
+
+def infer_attributes(cres, native=False):
+    """ Function attributes safe to put on a declaration of the function compiled in `cres` """
+    fndesc = cres.fndesc
+    if native:
+        return frozenset(infer_native_attributes(cres.library, fndesc.llvm_func_name))
+    return frozenset(infer_cfunc_attributes(cres.library, fndesc.llvm_func_name, fndesc.llvm_cfunc_wrapper_name))
+
+
+def infer_cfunc_object_attributes(cfunc):
+    """ Attributes of the wrapper of the compiled `numba.cfunc` `cfunc`, named after its function with a `cfunc.` prefix """
+    func_name = cfunc.native_name[len(CFUNC_WRAPPER_PREFIX):]
+    return frozenset(infer_cfunc_attributes(cfunc._library, func_name, cfunc.native_name))
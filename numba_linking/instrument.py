@@ -0,0 +1,82 @@
+import contextlib
+import llvmlite.binding as ll
+import numpy as np
+import os
+import typing
+from llvmlite import ir
+from numba.core import cgutils
+
+
+CALLS = 'calls'
+CYCLES = 'cycles'
+INSTRUMENT_MODES = (CALLS, CYCLES)
+
+COUNTERS_ENV = 'NUMBA_LINKING_COUNTERS'
+COUNTER_SFX = '_COUNTER'
+
+CALLS_IDX = 0
+CYCLES_IDX = 1
+
+i64_t = ir.IntType(64)
+counter_t = ir.ArrayType(i64_t, 2)
+
+counters = np.zeros((int(os.environ.get(COUNTERS_ENV, 4096)), 2), dtype=np.uint64)
+counter_slots: typing.Dict[str, int] = {}
+
+
+def get_counter_symbol(symbol):
+    return f"{symbol}{COUNTER_SFX}"
+
+
+def register_counter(symbol):
+    """ Assigns a row of `counters` to `symbol`; callers reference it by name, so cached callers stay valid """
+    if symbol not in counter_slots:
+        if len(counter_slots) == len(counters):
+            raise RuntimeError(f"Out of counters, increase {COUNTERS_ENV}={len(counters)}")
+        counter_slots[symbol] = len(counter_slots)
+        ll.add_symbol(get_counter_symbol(symbol), counters[counter_slots[symbol]].ctypes.data)
+    return counter_slots[symbol]
+
+
+def get_counters():
+    """ NumPy view of the `(calls, cycles)` rows of the instrumented symbols, in `counter_slots` order """
+    return counters[:len(counter_slots)]
+
+
+def get_counts(symbol):
+    calls, cycles = counters[counter_slots[symbol]]
+    return int(calls), int(cycles)
+
+
+def reset_counters():
+    counters[:] = 0
+
+
+def get_or_insert_counter(module, symbol):
+    name = get_counter_symbol(symbol)
+    counter = module.globals.get(name)
+    if counter is None:
+        counter = ir.GlobalVariable(module, counter_t, name)
+    return counter
+
+
+def atomic_add(builder, counter, idx, value):
+    ptr = builder.gep(counter, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), idx)])
+    builder.atomic_rmw('add', ptr, value, 'monotonic')
+
+
+@contextlib.contextmanager
+def count_call(builder, symbol, instrument):
+    """ Wraps the IR emitted in its body with the updates of the counters of `symbol`; emits nothing if not `instrument` """
+    if not instrument:
+        yield
+        return
+    counter = get_or_insert_counter(builder.module, symbol)
+    if instrument == CYCLES:
+        readcyclecounter = cgutils.get_or_insert_function(builder.module, ir.FunctionType(i64_t, []), 'llvm.readcyclecounter')
+        start = builder.call(readcyclecounter, [])
+        yield
+        atomic_add(builder, counter, CYCLES_IDX, builder.sub(builder.call(readcyclecounter, []), start))
+    else:
+        yield
+    atomic_add(builder, counter, CALLS_IDX, ir.Constant(i64_t, 1))
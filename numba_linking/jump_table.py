@@ -0,0 +1,126 @@
+import hashlib
+import operator
+from llvmlite import ir
+from numba.core import cgutils, types
+from numba.core.imputils import lower_constant
+from numba.experimental import function_type
+from numba.extending import intrinsic, models, overload, register_model, typeof_impl, unbox, NativeValue
+
+from numba_linking.bind_jit import func_sfx
+from numba_linking.registry import C_ABI, bound_functions, bound_symbols
+
+
+_ = function_type
+
+voidptr_t = ir.IntType(8).as_pointer()
+
+
+def get_bound_symbol(func, sig):
+    """ C-ABI symbol of the `bind_jit` function `func` for `sig`, linked so that callers can reference it """
+    func_name = func.py_func.__name__[:-len(func_sfx)]
+    selector = bound_functions.get(func_name)
+    if selector is None:
+        bound_symbol = bound_symbols.get(func_name)
+        if bound_symbol is None or bound_symbol.sig != sig:
+            raise ValueError(f"Expected a bind_jit function of signature {sig}, got {func}")
+        return func_name
+    if selector.abi != C_ABI or selector.swappable:
+        raise ValueError(f"Expected a bind_jit function with abi='c' and not swappable, got {func}")
+    if selector.sigs is None:
+        selector.specialize_sig(sig)
+    selected = selector.symbols.get(sig.args)
+    if selected is None or selected[0] != sig:
+        raise ValueError(f"Expected a bind_jit function of signature {sig}, got {func}")
+    selector.link(sig)
+    return selected[1]
+
+
+class JumpTable:
+    """
+    Table of bound functions of the same signature `sig`, indexed in njit code as `table[k](x, y)`.
+    Callers hold the table as a constant array of the addresses of the bound symbols,
+    so their code does not grow with the number of functions and a call is one indirect call.
+    """
+    def __init__(self, funcs, sig):
+        self.sig = sig
+        self.symbols = tuple(get_bound_symbol(func, sig) for func in funcs)
+
+    def __len__(self):
+        return len(self.symbols)
+
+
+class JumpTableType(types.Type):
+    def __init__(self, sig, symbols):
+        self.sig = sig
+        self.symbols = symbols
+        super().__init__(name=f"JumpTable({sig}, {', '.join(symbols)})")
+
+
+register_model(JumpTableType)(models.OpaqueModel)
+
+
+@typeof_impl.register(JumpTable)
+def typeof_jump_table(val, c):
+    return JumpTableType(val.sig, val.symbols)
+
+
+@lower_constant(JumpTableType)
+def constant_jump_table(context, builder, ty, pyval):
+    return context.get_constant_null(ty)
+
+
+@unbox(JumpTableType)
+def unbox_jump_table(typ, obj, c):
+    return NativeValue(c.context.get_constant_null(typ))
+
+
+def get_or_insert_table(context, module, table_t):
+    """ Private constant array of the addresses of the symbols of `table_t` in `module` """
+    name = f"jump_table.{hashlib.sha256(table_t.name.encode()).hexdigest()[:16]}"
+    table = module.globals.get(name)
+    if table is None:
+        sig = table_t.sig
+        func_t = ir.FunctionType(
+            context.get_value_type(sig.return_type), [context.get_value_type(arg) for arg in sig.args]
+        )
+        funcs = [cgutils.get_or_insert_function(module, func_t, symbol) for symbol in table_t.symbols]
+        table_ir_t = ir.ArrayType(voidptr_t, len(funcs))
+        table = cgutils.add_global_variable(module, table_ir_t, name)
+        table.initializer = ir.Constant(table_ir_t, [func.bitcast(voidptr_t) for func in funcs])
+        table.global_constant = True
+        table.linkage = 'private'
+    return table
+
+
+@intrinsic
+def _get_function(typingctx, table_t, k_t):
+    fnty = types.FunctionType(table_t.sig)
+
+    def codegen(context, builder, signature, args):
+        _, k = args
+        table = get_or_insert_table(context, builder.module, table_t)
+        addr = builder.load(builder.gep(table, [ir.Constant(ir.IntType(32), 0), k]))
+        func = cgutils.create_struct_proxy(fnty)(context, builder)
+        func.addr = addr
+        func.pyaddr = context.get_constant_null(types.voidptr)
+        return func._getvalue()
+    return fnty(table_t, k_t), codegen
+
+
+@overload(operator.getitem)
+def jump_table_getitem(table, k):
+    if isinstance(table, JumpTableType) and isinstance(k, types.Integer):
+        n = len(table.symbols)
+
+        def impl(table, k):
+            if k < 0 or k >= n:
+                raise IndexError("jump table index out of range")
+            return _get_function(table, k)
+        return impl
+
+
+@overload(len)
+def jump_table_len(table):
+    if isinstance(table, JumpTableType):
+        n = len(table.symbols)
+        return lambda table: n
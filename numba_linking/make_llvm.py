@@ -1,9 +1,10 @@
-import ctypes
 import llvmlite.binding as ll
 import llvmlite.ir as ir
 
 from ctypes import CFUNCTYPE, c_double
 
+from numba_linking.bind_external import get_symbol_address
+
 
 double_t = ir.DoubleType()
 
@@ -158,11 +159,8 @@ f_run_block:
 """
 
 
-def get_dy_calc_p():
-    libcalc = ctypes.CDLL('./libcalc.dylib')
-    add_f = libcalc.add
-    add_p = ctypes.cast(add_f, ctypes.c_void_p).value
-    return add_p
+def get_dy_calc_p(lib_path='./libcalc.dylib'):
+    return get_symbol_address(lib_path, 'add')
 
 
 def compile_run_func_dynamic():
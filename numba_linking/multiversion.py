@@ -0,0 +1,94 @@
+import functools
+import llvmlite.binding as ll
+import platform
+import typing
+from numba.core import codegen, cpu, externals, utils
+from numba.core.compiler_lock import global_compiler_lock
+from numba.core.registry import CPUDispatcher, CPUTarget, cpu_target
+
+
+class Variant(typing.NamedTuple):
+    """ Target of one version of a callee, `cpu` as LLVM names it and the features it needs from the running CPU """
+    name: str
+    cpu: str
+    features: typing.Tuple[str, ...]
+
+
+# x86-64 micro-architecture levels, best first
+X86_64_VARIANTS = (
+    Variant('x86-64-v4', 'x86-64-v4', ('avx512f', 'avx512bw', 'avx512cd', 'avx512dq', 'avx512vl')),
+    Variant('x86-64-v3', 'x86-64-v3', ('avx', 'avx2', 'bmi', 'bmi2', 'f16c', 'fma', 'lzcnt', 'movbe')),
+    Variant('x86-64-v2', 'x86-64-v2', ('cx16', 'popcnt', 'sse4.1', 'sse4.2', 'ssse3')),
+)
+
+VARIANTS = {'x86_64': X86_64_VARIANTS, 'AMD64': X86_64_VARIANTS}
+
+
+def get_default_variants():
+    return VARIANTS.get(platform.machine(), ())
+
+
+def get_host_features():
+    return {feature for feature, enabled in ll.get_host_cpu_features().items() if enabled}
+
+
+def select_variant(variants=None):
+    """ First of `variants`, by default the ones of the running architecture, that the running CPU supports """
+    host_features = get_host_features()
+    variants = get_default_variants() if variants is None else variants
+    return next((variant for variant in variants if set(variant.features) <= host_features), None)
+
+
+class VariantCodegen(codegen.JITCPUCodegen):
+    """ JIT code generator targeting `variant`, rather than the host or `NUMBA_CPU_NAME` as Numba's own """
+    def __init__(self, module_name, variant):
+        self.variant = variant
+        super().__init__(module_name)
+
+    def _get_host_cpu_name(self):
+        return self.variant.cpu
+
+    def _get_host_cpu_features(self):
+        return ','.join(f'+{feature}' for feature in self.variant.features)
+
+
+class VariantContext(cpu.CPUContext):
+    """ CPU context whose code generator is a `VariantCodegen` """
+    def __init__(self, typing_context, target, variant):
+        self.variant = variant
+        super().__init__(typing_context, target)
+
+    @global_compiler_lock
+    def init(self):
+        self.is32bit = utils.MACHINE_BITS == 32
+        self._internal_codegen = VariantCodegen("numba.exec", self.variant)
+        externals.c_math_functions.install(self)
+
+
+class VariantTarget(CPUTarget):
+    """ CPU target whose code generator targets `variant`; typing is shared with Numba's CPU target """
+    def __init__(self, variant):
+        super().__init__('cpu')
+        self.variant = variant
+
+    @functools.cached_property
+    def _toplevel_target_context(self):
+        return VariantContext(self.typing_context, self._target_name, self.variant)
+
+    @property
+    def typing_context(self):
+        return cpu_target.typing_context
+
+
+@functools.lru_cache(maxsize=None)
+def get_variant_dispatcher_class(variant):
+    return type(f"CPUDispatcher_{variant.name.replace('-', '_')}", (CPUDispatcher,), dict(targetdescr=VariantTarget(variant)))
+
+
+def make_variant_dispatcher(py_func, variant, jit_options):
+    """
+    njit dispatcher of `py_func` compiling for `variant` in a code generator of its own,
+    so its code cannot be linked into code of Numba's CPU target, e.g. it cannot call other njit functions.
+    """
+    options = dict(jit_options, nopython=True)
+    return get_variant_dispatcher_class(variant)(py_func, targetoptions=options)
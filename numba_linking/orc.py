@@ -0,0 +1,109 @@
+import llvmlite.binding as ll
+import threading
+import typing
+
+
+class OrcModule(typing.NamedTuple):
+    name: str
+    ir: str
+    defined: frozenset
+    declared: frozenset
+
+
+def get_host_target_machine(opt=3):
+    target = ll.Target.from_default_triple()
+    return target.create_target_machine(cpu=ll.get_host_cpu_name(), features=ll.get_host_cpu_features().flatten(), opt=opt)
+
+
+def optimize_module(module, opt=3):
+    pmb = ll.create_pass_manager_builder()
+    pmb.opt_level = opt
+    pm = ll.create_module_pass_manager()
+    pmb.populate(pm)
+    pm.run(module)
+
+
+class OrcLinker:
+    """
+    One LLJIT session holding many modules, each in a JIT library of its own.
+    `add_module` only records a module; the first `get_address` of one of its symbols links it,
+    after the libraries defining the symbols it declares, and ORC compiles it on that lookup.
+    Other symbols, e.g. the ones added with `ll.add_symbol`, are looked up in the current process.
+    It holds the modules of `bind_llvm(link='orc')`, Numba compiles `bind_jit` callees in its own engine.
+    """
+    def __init__(self, target_machine=None):
+        ll.initialize()
+        ll.initialize_native_target()
+        ll.initialize_native_asmprinter()
+        self.target_machine = get_host_target_machine() if target_machine is None else target_machine
+        self.lljit = ll.create_lljit_compiler(self.target_machine)
+        self.modules: typing.Dict[str, OrcModule] = {}
+        self.libraries: typing.Dict[str, str] = {}
+        self.trackers: typing.Dict[str, typing.Any] = {}
+        self.addresses: typing.Dict[str, int] = {}
+        self.lock = threading.RLock()
+
+    def prepare_module(self, module, opt=3):
+        """ Sets the triple and data layout of `module` to the ones of the session, and optimizes it """
+        module.triple = self.target_machine.triple
+        module.data_layout = str(self.lljit.target_data)
+        module.verify()
+        optimize_module(module, opt)
+        return module
+
+    def add_module(self, module, name=None):
+        """ Records the `ll.ModuleRef` `module` under the library `name`, returns the names of the functions it defines """
+        name = module.name if name is None else name
+        defined = frozenset(func.name for func in module.functions if not func.is_declaration)
+        declared = frozenset(func.name for func in module.functions if func.is_declaration)
+        with self.lock:
+            if name in self.modules:
+                raise ValueError(f"Library {name} already added")
+            conflicts = [symbol for symbol in defined if symbol in self.libraries]
+            if conflicts:
+                raise ValueError(f"Symbols {conflicts} of {name} are already defined in {self.libraries[conflicts[0]]}")
+            self.modules[name] = OrcModule(name, str(module), defined, declared)
+            self.libraries.update((symbol, name) for symbol in defined)
+        return defined
+
+    def materialize(self, name):
+        """ Links the library `name`, and the libraries it depends on, into the session """
+        if name in self.trackers:
+            return
+        module = self.modules[name]
+        dependencies = sorted({self.libraries[symbol] for symbol in module.declared if symbol in self.libraries} - {name})
+        # the tracker keeps the library loaded, added before its dependencies to stop cycles
+        self.trackers[name] = None
+        for dependency in dependencies:
+            self.materialize(dependency)
+        builder = ll.JITLibraryBuilder().add_ir(module.ir)
+        for dependency in dependencies:
+            builder.add_jit_library(dependency)
+        builder.add_current_process()
+        self.trackers[name] = builder.link(self.lljit, name)
+
+    def get_address(self, symbol):
+        """ Address of the function `symbol` of an added module, compiled on the first call """
+        with self.lock:
+            address = self.addresses.get(symbol)
+            if address is None:
+                name = self.libraries[symbol]
+                self.materialize(name)
+                tracker = self.lljit.lookup(name, symbol)
+                address = self.addresses[symbol] = tracker[symbol]
+                self.trackers[f"{name}:{symbol}"] = tracker
+            return address
+
+    def is_materialized(self, symbol):
+        return symbol in self.addresses
+
+
+orc_linker: typing.Optional[OrcLinker] = None
+
+
+def get_orc_linker():
+    """ The session shared by `bind_llvm(link='orc')` """
+    global orc_linker
+    if orc_linker is None:
+        orc_linker = OrcLinker()
+    return orc_linker
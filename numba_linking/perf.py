@@ -0,0 +1,155 @@
+import ctypes
+import mmap
+import os
+import platform
+import struct
+import threading
+import time
+
+from numba_linking.infer_attrs import get_object_code
+from numba_linking.registry import get_sig_str
+
+
+PERF_ENV = 'NUMBA_LINKING_PERF'
+PERF_MAP = 'map'
+JITDUMP = 'jitdump'
+PERF_MODES = (PERF_MAP, JITDUMP)
+
+PERF_DIR = '/tmp'
+
+# https://github.com/torvalds/linux/blob/master/tools/perf/Documentation/jitdump-specification.txt
+JITDUMP_MAGIC = 0x4A695444
+JITDUMP_VERSION = 1
+JIT_CODE_LOAD = 0
+ELF_MACHINES = {'x86_64': 62, 'AMD64': 62, 'aarch64': 183, 'arm64': 183, 'ppc64le': 21}
+
+ELF_MAGIC = b'\x7fELF'
+SHT_SYMTAB = 2
+STT_FUNC = 2
+
+enabled_modes = frozenset()
+jitdump_file = None
+jitdump_marker = None
+code_index = 0
+recorded = set()
+lock = threading.Lock()
+
+
+def get_perf_map_path(pid=None):
+    return os.path.join(PERF_DIR, f"perf-{os.getpid() if pid is None else pid}.map")
+
+
+def get_jitdump_path(pid=None):
+    return os.path.join(PERF_DIR, f"jit-{os.getpid() if pid is None else pid}.dump")
+
+
+def get_timestamp():
+    """ Timestamp of jitdump records, perf must be run with `-k mono` to match them to samples """
+    return time.clock_gettime_ns(time.CLOCK_MONOTONIC)
+
+
+def open_jitdump():
+    """ Creates the jitdump file and maps it executable, which is how `perf record` finds it """
+    global jitdump_file, jitdump_marker
+    f = open(get_jitdump_path(), 'wb+')
+    header = struct.pack(
+        '<IIIIIIQQ', JITDUMP_MAGIC, JITDUMP_VERSION, 40, ELF_MACHINES.get(platform.machine(), 0), 0, os.getpid(),
+        get_timestamp(), 0
+    )
+    f.write(header)
+    f.flush()
+    jitdump_marker = mmap.mmap(f.fileno(), len(header), mmap.MAP_PRIVATE, mmap.PROT_READ | mmap.PROT_EXEC)
+    jitdump_file = f
+
+
+def close_jitdump():
+    """ Stops the jitdump records, unmapping and closing the jitdump file """
+    global enabled_modes, jitdump_file, jitdump_marker
+    with lock:
+        enabled_modes = enabled_modes - {JITDUMP}
+        if jitdump_marker is not None:
+            jitdump_marker.close()
+        if jitdump_file is not None:
+            jitdump_file.close()
+        jitdump_file = jitdump_marker = None
+
+
+def enable_perf(modes=PERF_MODES):
+    """
+    Makes `record_library` describe the code of bound symbols to Linux `perf`,
+    in `/tmp/perf-<pid>.map` with `'map'` and in `/tmp/jit-<pid>.dump` with `'jitdump'`.
+    """
+    global enabled_modes
+    modes = frozenset(modes)
+    if not modes <= set(PERF_MODES):
+        raise ValueError(f"Expected modes among {PERF_MODES}, got {sorted(modes)}")
+    with lock:
+        if JITDUMP in modes and jitdump_file is None:
+            open_jitdump()
+        enabled_modes = modes
+
+
+def get_function_sizes(obj):
+    """ Sizes of the functions defined in the ELF object code `obj`, by name; empty for other formats """
+    if obj[:4] != ELF_MAGIC or obj[4] != 2 or obj[5] != 1:
+        return {}
+    shoff, = struct.unpack_from('<Q', obj, 0x28)
+    shentsize, shnum = struct.unpack_from('<HH', obj, 0x3A)
+    sections = [struct.unpack_from('<IIQQQQIIQQ', obj, shoff + i * shentsize) for i in range(shnum)]
+    sizes = {}
+    for _, sh_type, _, _, offset, size, link, _, _, entsize in sections:
+        if sh_type != SHT_SYMTAB:
+            continue
+        strtab_offset = sections[link][4]
+        for entry in range(offset, offset + size, entsize):
+            st_name, st_info, _, st_shndx, _, st_size = struct.unpack_from('<IBBHQQ', obj, entry)
+            if st_info & 0xF == STT_FUNC and st_shndx != 0 and st_size:
+                end = obj.index(b'\0', strtab_offset + st_name)
+                sizes[obj[strtab_offset + st_name:end].decode()] = st_size
+    return sizes
+
+
+def write_jitdump_record(name, address, size):
+    global code_index
+    name_bytes = name.encode() + b'\0'
+    record = struct.pack(
+        '<IIQIIQQQQ', JIT_CODE_LOAD, 16 + 40 + len(name_bytes) + size, get_timestamp(),
+        os.getpid(), threading.get_native_id(), address, address, size, code_index
+    )
+    jitdump_file.write(record + name_bytes + ctypes.string_at(address, size))
+    jitdump_file.flush()
+    code_index += 1
+
+
+def record_library(library, symbol, name, sig):
+    """
+    Describes the functions of the Numba code `library` to `perf`, the function `name` under the bound `symbol`
+    and its signature `sig`, the others under their mangled names, which `perf` demangles.
+    """
+    if not enabled_modes:
+        return
+    sizes = get_function_sizes(get_object_code(library))
+    entries = [
+        (f"{symbol} {get_sig_str(sig)}" if func_name == name else func_name, library.get_pointer_to_function(func_name), size)
+        for func_name, size in sizes.items()
+    ]
+    with lock:
+        entries = [entry for entry in entries if entry[1] and entry[1] not in recorded]
+        recorded.update(address for _, address, _ in entries)
+        if PERF_MAP in enabled_modes:
+            with open(get_perf_map_path(), 'a') as f:
+                f.writelines(f"{address:x} {size:x} {name_}\n" for name_, address, size in entries)
+        if JITDUMP in enabled_modes:
+            for name_, address, size in entries:
+                write_jitdump_record(name_, address, size)
+
+
+def record_compile_result(symbol, sig, cres, native=False):
+    """ `record_library` for the overload `cres` bound as `symbol`, through its cfunc wrapper unless `native` """
+    name = cres.fndesc.llvm_func_name if native else cres.fndesc.llvm_cfunc_wrapper_name
+    record_library(cres.library, symbol, name, sig)
+
+
+perf_env = os.environ.get(PERF_ENV)
+if perf_env:
+    enable_perf(perf_env.split(','))
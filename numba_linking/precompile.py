@@ -0,0 +1,96 @@
+import contextlib
+import importlib
+import multiprocessing
+import os
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from numba.core.caching import NullCache
+from numba.core.registry import CPUDispatcher
+
+from numba_linking.aot import import_package_modules
+from numba_linking.bind_jit import LAZY_ENV, func_sfx
+from numba_linking.registry import (
+    bound_symbols, get_cache_count, get_compile_result, get_func_names, get_package_symbols, resolve_symbol
+)
+
+
+class PrecompileRecord(typing.NamedTuple):
+    symbol: str
+    module: str
+    seconds: float
+    cache_hit: bool
+    cacheable: bool
+
+
+def get_wrapper(module, symbol):
+    """ njit wrapper callers call `symbol` through, None if it is not in the namespace of `module` """
+    wrapper = getattr(importlib.import_module(module), f"{get_func_names()[symbol]}{func_sfx}", None)
+    return wrapper if isinstance(wrapper, CPUDispatcher) else None
+
+
+def precompile_symbol(module, symbol):
+    """
+    Compiles, or loads from the on-disk cache, one bound callee and links its symbol, then compiles its wrapper,
+    as the first compile of a caller would; runs in a worker process.
+    """
+    importlib.import_module(module)
+    bound_symbol = bound_symbols[symbol]
+    start = time.perf_counter()
+    resolve_symbol(symbol)
+    get_compile_result(bound_symbol)
+    wrapper = get_wrapper(module, symbol)
+    if wrapper is not None:
+        wrapper.compile(bound_symbol.sig)
+    seconds = time.perf_counter() - start
+    jit_func = bound_symbol.jit_func
+    cache_hit = get_cache_count(jit_func.stats.cache_hits, bound_symbol.sig) > 0
+    cache_hit = cache_hit and get_cache_count(jit_func.stats.cache_misses, bound_symbol.sig) == 0
+    return PrecompileRecord(symbol, module, seconds, cache_hit, not isinstance(jit_func._cache, NullCache))
+
+
+def precompile_function(module, symbols):
+    """
+    `precompile_symbol` for each symbol of one function in turn, in one worker process,
+    as they are compiled by the same dispatchers, which save them into the same on-disk cache index
+    """
+    return [precompile_symbol(module, symbol) for symbol in symbols]
+
+
+def group_symbols(symbols):
+    """ Symbols of the bound symbols `symbols` by module and function """
+    func_names = get_func_names()
+    groups = {}
+    for bound_symbol in symbols:
+        groups.setdefault((bound_symbol.module, func_names[bound_symbol.symbol]), []).append(bound_symbol.symbol)
+    return groups
+
+
+@contextlib.contextmanager
+def deferred_compilation():
+    """ Makes `bind_jit` lazy by default, in this process and in the worker processes it starts """
+    lazy = os.environ.get(LAZY_ENV)
+    os.environ[LAZY_ENV] = '1'
+    try:
+        yield
+    finally:
+        if lazy is None:
+            del os.environ[LAZY_ENV]
+        else:
+            os.environ[LAZY_ENV] = lazy
+
+
+def precompile(package, max_workers=None):
+    """
+    Fills the on-disk cache of the `bind_jit` callees of `package`, and of their wrappers, in a process pool.
+    Callees do not depend on each other's IR, so each function is compiled in a worker of its own,
+    its signatures in turn, which Numba saves into the same cache index, that concurrent saves could corrupt.
+    Callees without `cache=True` are compiled too but are reported as not cacheable, each process compiles them again.
+    """
+    with deferred_compilation():
+        import_package_modules(package)
+        groups = group_symbols(get_package_symbols(package))
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = [executor.submit(precompile_function, module, symbols) for (module, _), symbols in groups.items()]
+            return [record for future in futures for record in future.result()]
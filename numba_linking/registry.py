@@ -0,0 +1,140 @@
+import hashlib
+import importlib
+import inspect
+import typing
+from numba.core import sigutils
+from numba.core.itanium_mangler import mangle_args
+
+
+C_ABI = 'c'
+NATIVE_ABI = 'native'
+
+BIND_JIT_SFX = '_BIND_JIT_SFX'
+
+
+class BoundSymbol(typing.NamedTuple):
+    symbol: str
+    sig: typing.Any
+    abi: str
+    jit_func: typing.Any
+    module: str
+
+
+bound_symbols: typing.Dict[str, BoundSymbol] = {}
+bound_functions: typing.Dict[str, typing.Any] = {}
+linkers: typing.Dict[str, typing.Callable[[], None]] = {}
+symbol_attributes: typing.Dict[str, frozenset] = {}
+specializers: typing.Dict[str, typing.Callable[[typing.Any], None]] = {}
+resolvers: typing.List[typing.Callable[[str], None]] = []
+
+
+def register_symbol(symbol, sig, abi, jit_func, link=None):
+    """ `link`, if given, makes `symbol` available with `ll.add_symbol`, for symbols that are not yet """
+    bound_symbols[symbol] = BoundSymbol(symbol, sig, abi, jit_func, jit_func.py_func.__module__)
+    if link is not None:
+        linkers[symbol] = link
+
+
+def register_attributes(symbol, attrs):
+    """ Attributes the declarations of `symbol` in callers get, once it is linked """
+    symbol_attributes[symbol] = frozenset(attrs)
+
+
+def register_function(func_name, selector):
+    """ `bind_jit` functions by name, with the `SymbolSelector` that binds their symbols """
+    bound_functions[func_name] = selector
+
+
+def register_specializer(func_name, specialize):
+    """ `specialize(sig)` binds the symbol of the function `func_name` for `sig`, for functions bound when first typed """
+    specializers[func_name] = specialize
+
+
+def add_resolver(resolver):
+    """ `resolver(symbol)` is called for symbols unknown to `resolve_symbol`, e.g. to import a module or load a library """
+    resolvers.append(resolver)
+
+
+def get_sig_str(sig):
+    """ `sig` in the form `sigutils.normalize_signature` parses, e.g. `float64(float64, float64)` """
+    return f"{sig.return_type}({', '.join(str(arg) for arg in sig.args)})"
+
+
+def update_code_hash(h, code):
+    h.update(code.co_code)
+    h.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            update_code_hash(h, const)
+        else:
+            # the order of a frozenset of strings differs between processes
+            h.update(repr(sorted(map(repr, const)) if isinstance(const, frozenset) else const).encode())
+
+
+def get_code_hash(py_func):
+    """
+    Hash of the bytecode of `py_func`, with its names, constants and nested functions, but not where it is defined.
+    `marshal.dumps` is not used, its output depends on reference counts, which differ between processes.
+    """
+    h = hashlib.sha256()
+    update_code_hash(h, py_func.__code__)
+    return h.hexdigest()[:16]
+
+
+def get_cache_count(counter, sig):
+    """ Count of `sig` in `stats.cache_hits` or `stats.cache_misses` of a dispatcher, keyed by what `compile` was given """
+    return sum(count for key, count in counter.items() if sigutils.normalize_signature(key)[0] == sig.args)
+
+
+def get_specialized_func_name(symbol, args):
+    """ Name of the function whose specialization for `args` is `symbol`, see `bind_jit.get_symbol_name` """
+    suffix = f"_{mangle_args(args)}{BIND_JIT_SFX}"
+    return symbol[:-len(suffix)] if symbol.endswith(suffix) else None
+
+
+def specialize_symbol(symbol, sig_str):
+    args, return_type = sigutils.normalize_signature(sig_str)
+    specialize = specializers.get(get_specialized_func_name(symbol, args))
+    if specialize is not None:
+        specialize(return_type(*args))
+
+
+def resolve_symbol(symbol, module=None, sig_str=None):
+    """
+    Makes the bound symbol `symbol` available to the linker before code declaring it is finalized,
+    importing `module`, which defines it, compiling it if it is lazy, or calling the registered resolvers.
+    """
+    if symbol not in bound_symbols and module is not None:
+        importlib.import_module(module)
+    if symbol not in bound_symbols and sig_str is not None:
+        specialize_symbol(symbol, sig_str)
+    for resolver in resolvers:
+        if symbol in bound_symbols:
+            break
+        resolver(symbol)
+    link = linkers.get(symbol)
+    if link is not None:
+        link()
+    return symbol in bound_symbols
+
+
+def get_func_names():
+    """ Name of the wrapper of each bound symbol, without its suffix """
+    func_names = {symbol: symbol for symbol in bound_symbols}
+    for func_name, selector in bound_functions.items():
+        func_names.update((symbol, func_name) for _, symbol in selector.symbols.values())
+    return func_names
+
+
+def get_compile_result(bound_symbol):
+    jit_func = bound_symbol.jit_func
+    if bound_symbol.sig.args not in jit_func.overloads:
+        jit_func.compile(bound_symbol.sig)
+    return jit_func.overloads[bound_symbol.sig.args]
+
+
+def get_package_symbols(package):
+    return [
+        bound_symbol for bound_symbol in bound_symbols.values()
+        if bound_symbol.module == package or bound_symbol.module.startswith(f'{package}.')
+    ]
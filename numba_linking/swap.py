@@ -0,0 +1,46 @@
+import llvmlite.binding as ll
+import numpy as np
+import os
+import typing
+from llvmlite import ir
+
+
+SLOTS_ENV = 'NUMBA_LINKING_SLOTS'
+SLOT_SFX = '_SLOT'
+
+slot_t = ir.IntType(8).as_pointer()
+
+slots = np.zeros(int(os.environ.get(SLOTS_ENV, 4096)), dtype=np.uintp)
+slot_indices: typing.Dict[str, int] = {}
+
+
+def get_slot_symbol(symbol):
+    return f"{symbol}{SLOT_SFX}"
+
+
+def register_slot(symbol):
+    """ Assigns an entry of `slots` to `symbol`; callers load the address they call from it by name """
+    if symbol not in slot_indices:
+        if len(slot_indices) == len(slots):
+            raise RuntimeError(f"Out of slots, increase {SLOTS_ENV}={len(slots)}")
+        slot_indices[symbol] = len(slot_indices)
+        ll.add_symbol(get_slot_symbol(symbol), slots[slot_indices[symbol]:].ctypes.data)
+    return slot_indices[symbol]
+
+
+def set_slot(symbol, address):
+    slots[register_slot(symbol)] = address
+
+
+def get_slot(symbol):
+    return int(slots[slot_indices[symbol]])
+
+
+def load_slot(builder, func_t, symbol):
+    """ Emits a load of the address in the slot of `symbol`, cast to a pointer to `func_t` """
+    name = get_slot_symbol(symbol)
+    slot = builder.module.globals.get(name)
+    if slot is None:
+        slot = ir.GlobalVariable(builder.module, slot_t, name)
+    func_p = builder.load_atomic(slot, 'monotonic', slots.itemsize)
+    return builder.bitcast(func_p, func_t.as_pointer())
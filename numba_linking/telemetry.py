@@ -0,0 +1,153 @@
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+import typing
+from numba.core import event
+
+from numba_linking.infer_attrs import get_ir_size, get_object_code
+from numba_linking.registry import bound_symbols, get_cache_count, get_func_names, get_sig_str
+
+
+TELEMETRY_ENV = 'NUMBA_LINKING_TELEMETRY'
+
+CALLEE = 'callee'
+WRAPPER_ADDRESS = 'wrapper_address'
+WRAPPER = 'wrapper'
+
+
+class CompileRecord(typing.NamedTuple):
+    """ Where the startup time of one bound symbol went, in seconds, and the size of its callee """
+    symbol: str
+    module: str
+    sig: str
+    callee_s: float
+    wrapper_address_s: float
+    wrapper_s: float
+    ir_size: int
+    object_bytes: int
+    cache_hit: bool
+
+
+enabled = False
+listener = None
+times: typing.Dict[tuple, float] = {}
+wrappers: typing.Dict[str, str] = {}
+# timers nest per thread, e.g. in a thread compiling callees while another one compiles a caller
+local = threading.local()
+
+
+def get_stack() -> typing.List[list]:
+    if not hasattr(local, 'stack'):
+        local.stack = []
+    return local.stack
+
+
+def start_timer():
+    get_stack().append([time.perf_counter(), 0.0])
+
+
+def stop_timer(key):
+    """ Adds the time since the matching `start_timer` to `key`, less the time of the timers nested in it """
+    stack = get_stack()
+    start, nested = stack.pop()
+    elapsed = time.perf_counter() - start
+    if stack:
+        stack[-1][1] += elapsed
+    times[key] = times.get(key, 0.0) + elapsed - nested
+
+
+@contextlib.contextmanager
+def timed(kind, symbol):
+    """ Times its body as the `kind` step of binding `symbol`, if telemetry is enabled """
+    if not enabled:
+        yield
+        return
+    start_timer()
+    try:
+        yield
+    finally:
+        stop_timer((kind, symbol))
+
+
+def get_wrapped_func_name(ev):
+    py_func = getattr(ev.data['dispatcher'], 'py_func', None)
+    return wrappers.get(getattr(py_func, '__name__', None))
+
+
+class WrapperListener(event.Listener):
+    """ Times the compiles of the wrappers of bound functions, the only `numba:compile` events it times """
+    def on_start(self, ev):
+        if get_wrapped_func_name(ev) is not None:
+            start_timer()
+
+    def on_end(self, ev):
+        func_name = get_wrapped_func_name(ev)
+        if func_name is not None:
+            stop_timer((WRAPPER, func_name, tuple(ev.data['args'])))
+
+
+def register_wrapper(wrapper_name, func_name):
+    """ Makes the compiles of the njit function `wrapper_name` count as wrapper compiles of the symbols of `func_name` """
+    wrappers[wrapper_name] = func_name
+
+
+def enable_telemetry():
+    """ Starts recording the steps of binding functions, see `get_compile_records` """
+    global enabled, listener
+    if not enabled:
+        listener = WrapperListener()
+        event.register('numba:compile', listener)
+        enabled = True
+
+
+def disable_telemetry():
+    """ Stops recording, the times recorded so far are kept """
+    global enabled, listener
+    if enabled:
+        event.unregister('numba:compile', listener)
+        listener = None
+        enabled = False
+
+
+def get_object_bytes(library):
+    """ Size of the object code of `library` """
+    return len(get_object_code(library))
+
+
+def get_compile_records():
+    """ `CompileRecord` of each bound symbol whose callee is compiled, or loaded from cache """
+    records = []
+    func_names = get_func_names()
+    for symbol, bound_symbol in bound_symbols.items():
+        sig, jit_func = bound_symbol.sig, bound_symbol.jit_func
+        cres = jit_func.overloads.get(sig.args)
+        if cres is None:
+            continue
+        func_name = func_names[symbol]
+        records.append(CompileRecord(
+            symbol, bound_symbol.module, get_sig_str(sig),
+            times.get((CALLEE, symbol), 0.0),
+            times.get((WRAPPER_ADDRESS, symbol), 0.0),
+            times.get((WRAPPER, func_name, sig.args), 0.0),
+            get_ir_size(cres.library),
+            get_object_bytes(cres.library),
+            get_cache_count(jit_func.stats.cache_hits, sig) > 0,
+        ))
+    return records
+
+
+def dump_compile_records(path):
+    """ Writes the `CompileRecord`s, and their totals, as JSON to `path` """
+    records = [record._asdict() for record in get_compile_records()]
+    totals = {key: sum(record[key] for record in records) for key in CompileRecord._fields[3:]}
+    with open(path, 'w') as f:
+        json.dump(dict(records=records, totals=totals), f, indent=2)
+
+
+telemetry_path = os.environ.get(TELEMETRY_ENV)
+if telemetry_path:
+    enable_telemetry()
+    atexit.register(dump_compile_records, telemetry_path)
@@ -0,0 +1,115 @@
+import llvmlite.binding as ll
+from llvmlite import ir
+from numba.core import cgutils, types
+from numba.core.compiler_lock import global_compiler_lock
+
+
+VECTOR_SFX = '_V'
+VECTOR_WIDTHS = (2, 4, 8)
+
+# https://llvm.org/docs/LangRef.html#call-site-attributes, LLVM 14 reads it from calls, not from declarations
+VFABI_ATTR = 'vector-function-abi-variant'
+# ISA token of variants following LLVM's own vector calling convention for the target of the callers
+VFABI_ISA = '_LLVM_'
+
+COMPILER_USED = 'llvm.compiler.used'
+
+i8p_t = ir.IntType(8).as_pointer()
+
+
+class VariantCallAttributes(ir.CallInstrAttributes):
+    """ `ir.CallInstrAttributes` that also accepts the string attribute naming the vector variants of the callee """
+    def add(self, name):
+        if name.startswith(f'"{VFABI_ATTR}"='):
+            return set.add(self, name)
+        return super().add(name)
+
+
+def get_vector_name(symbol, width):
+    return f"{symbol}{VECTOR_SFX}{width}"
+
+
+def get_vfabi_name(symbol, width, nargs):
+    """ Vector Function ABI name of the unmasked variant of `symbol` taking `nargs` vectors of `width` lanes """
+    return f"_ZGV{VFABI_ISA}N{width}{'v' * nargs}_{symbol}({get_vector_name(symbol, width)})"
+
+
+def is_vectorizable(sig):
+    """ Whether the arguments and the result of `sig` are integers or floats, which vector types hold """
+    return all(isinstance(typ, (types.Integer, types.Float)) for typ in (sig.return_type, *sig.args))
+
+
+def get_vector_function_type(context, sig, width):
+    def vector_t(typ):
+        return ir.VectorType(context.get_value_type(typ), width)
+    return ir.FunctionType(vector_t(sig.return_type), [vector_t(arg) for arg in sig.args])
+
+
+def define_vector_variant(context, module, cres, symbol, width):
+    """ Defines the variant of `symbol` of `width` lanes, calling the Numba-ABI function of `cres` on each lane """
+    sig = cres.signature
+    func = ir.Function(module, get_vector_function_type(context, sig, width), get_vector_name(symbol, width))
+    func_t = context.call_conv.get_function_type(sig.return_type, sig.args)
+    callee = cgutils.get_or_insert_function(module, func_t, cres.fndesc.llvm_func_name)
+    builder = ir.IRBuilder(func.append_basic_block())
+    res = ir.Constant(func.function_type.return_type, ir.Undefined)
+    for lane in range(width):
+        args = [builder.extract_element(arg, ir.Constant(ir.IntType(32), lane)) for arg in func.args]
+        # the status is dropped, as the cfunc wrapper of the scalar symbol does
+        _, lane_res = context.call_conv.call_function(builder, callee, sig.return_type, sig.args, args)
+        res = builder.insert_element(res, lane_res, ir.Constant(ir.IntType(32), lane))
+    builder.ret(res)
+    return func
+
+
+@global_compiler_lock
+def add_vector_variants(cres, symbol, widths=VECTOR_WIDTHS):
+    """
+    Compiles the variants of `symbol` of each of `widths` lanes and adds them with `ll.add_symbol`.
+    The overload `cres` is linked into them, so LLVM inlines it per lane and its SLP vectorizer merges the lanes.
+    Returns their code library, which must be kept alive.
+    """
+    library = cres.library.codegen.create_library(f"{symbol}{VECTOR_SFX}")
+    module = library.create_ir_module(f"{symbol}{VECTOR_SFX}")
+    for width in widths:
+        define_vector_variant(cres.target_context, module, cres, symbol, width)
+    library.add_ir_module(module)
+    library.add_linking_library(cres.library)
+    library.finalize()
+    for width in widths:
+        name = get_vector_name(symbol, width)
+        ll.add_symbol(name, library.get_pointer_to_function(name))
+    return library
+
+
+def add_compiler_used(module, funcs):
+    """ Adds `funcs` to `llvm.compiler.used` of `module`, which keeps unused declarations until code generation """
+    used = module.globals.get(COMPILER_USED)
+    values = [] if used is None else list(used.initializer.constant)
+    values += [value for value in (func.bitcast(i8p_t) for func in funcs) if str(value) not in map(str, values)]
+    used_t = ir.ArrayType(i8p_t, len(values))
+    if used is None:
+        used = ir.GlobalVariable(module, used_t, COMPILER_USED)
+        used.linkage = 'appending'
+        used.section = 'llvm.metadata'
+    # the global is only referenced by name, so its type can grow with its initializer
+    used.value_type, used.type = used_t, used_t.as_pointer()
+    used.initializer = ir.Constant(used_t, values)
+
+
+def attach_vector_variants(context, builder, call, sig, widths=VECTOR_WIDTHS):
+    """
+    Declares the vector variants of the callee of `call` and names them in its `vector-function-abi-variant` attribute,
+    so that the loop vectorizer can replace `call` in a loop by calls of a variant.
+    """
+    symbol = call.callee.name
+    funcs = [
+        cgutils.get_or_insert_function(
+            builder.module, get_vector_function_type(context, sig, width), get_vector_name(symbol, width)
+        )
+        for width in widths
+    ]
+    add_compiler_used(builder.module, funcs)
+    variants = ','.join(get_vfabi_name(symbol, width, len(sig.args)) for width in widths)
+    call.attributes = VariantCallAttributes(set(call.attributes) | {f'"{VFABI_ATTR}"="{variants}"'})
+    return call
@@ -0,0 +1,21 @@
+import numba
+
+from numba_linking.bind_jit import bind_jit
+
+
+aot_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(aot_sig, cache=True)
+def aot_add(x, y):
+    return x + y + 2.172
+
+
+@bind_jit([aot_sig, numba.int64(numba.int64, numba.int64)], abi='native', cache=True)
+def aot_mul(x, y):
+    return x * y
+
+
+@numba.njit(aot_sig)
+def aot_run(x, y):
+    return aot_add(x, y) * aot_mul(x, y)
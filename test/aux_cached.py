@@ -0,0 +1,41 @@
+import numba
+
+from numba_linking.bind_jit import bind_jit
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig, lazy=True, cache=True)
+def cached_add(x, y):
+    return x + y
+
+
+@bind_jit([calculate_sig], lazy=True, swappable=True)
+def cached_sub(x, y):
+    return x - y
+
+
+@bind_jit(calculate_sig)
+def cached_mul(x, y):
+    return x * y
+
+
+@bind_jit(cache=True)
+def cached_div(x, y):
+    return x / y
+
+
+@bind_jit()
+def cached_pow(x, y):
+    return x ** y
+
+
+@numba.njit(cache=True)
+def cached_run(x, y):
+    return cached_add(x, y) + cached_sub(x, y) + cached_mul(x, y) + cached_div(x, y)
+
+
+@numba.njit(cache=True)
+def cached_pow_run(x, y):
+    return cached_pow(x, y)
@@ -0,0 +1,19 @@
+import numba
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.dependencies import checked_njit
+
+
+@bind_jit(numba.float64(numba.float64, numba.float64), lazy=True)
+def resolve_add(x, y):
+    return x + y
+
+
+@bind_jit(lazy=True)
+def resolve_mul(x, y):
+    return x * y
+
+
+@checked_njit(cache=True)
+def resolve_run(x, y):
+    return resolve_add(x, y) * resolve_mul(x, y)
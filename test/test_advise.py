@@ -0,0 +1,62 @@
+import numba
+import numpy as np
+
+from numba_linking.advise import advise, apply_advice
+from numba_linking.bind_jit import BIND_JIT_SFX
+
+
+@numba.njit
+def advise_leaf(x):
+    s = 0.0
+    for i in range(10):
+        s += np.sin(x * i) * np.cos(x + i) / (1 + x * x)
+    return s
+
+
+@numba.njit
+def advise_mid_a(x):
+    return advise_leaf(x) + advise_leaf(x + 1.0)
+
+
+@numba.njit
+def advise_mid_b(x):
+    return 2.0 * advise_leaf(x)
+
+
+@numba.njit
+def advise_tiny(x):
+    return x + 1.0
+
+
+# not referenced by the callers, so not rebound
+leaf_alias = advise_leaf
+
+
+@numba.njit
+def advise_root(x):
+    return advise_mid_a(x) + advise_mid_b(x) + advise_tiny(x)
+
+
+def test_advise():
+    expected = advise_root(1.0)
+    advice = advise(advise_root)
+    callees = {callee.func.py_func.__name__: callee for callee in advice.callees}
+    assert sorted(callees) == ['advise_leaf', 'advise_mid_a', 'advise_mid_b', 'advise_tiny']
+    assert callees['advise_leaf'].call_sites == 3
+    assert callees['advise_leaf'].copies == 4
+    assert callees['advise_leaf'].bind
+    assert not callees['advise_tiny'].bind
+    assert advice.callees[0].func is advise_leaf
+    assert advice.projected['ir_size'] < advice.totals['ir_size']
+    assert advice.projected['cache_bytes'] < advice.totals['cache_bytes']
+
+    leaf, mid_a, mid_b = advise_leaf, advise_mid_a, advise_mid_b
+    bound = apply_advice(advice)
+    assert set(bound) == {leaf, mid_a, mid_b}
+    assert advise_leaf is bound[leaf]
+    assert leaf_alias is leaf
+    assert advise_root(1.0) == expected
+    root_llvm = next(iter(advise_root.inspect_llvm().values()))
+    assert f'declare double @advise_mid_a_d{BIND_JIT_SFX}(double)' in root_llvm
+    assert 'llvm.sin' not in root_llvm
+    assert advise(advise_root).totals['ir_size'] < advice.projected['ir_size']
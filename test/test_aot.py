@@ -0,0 +1,39 @@
+import json
+import os
+import subprocess
+import sys
+
+from numba_linking.aot import AOT_LIBS_ENV, get_manifest_path
+from numba_linking.__main__ import main
+
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+check_aot_code = """
+import ctypes
+from numba_linking.aot import aot_symbols
+from numba_linking.bind_jit import SELECT_SFX
+import test.aux_aot as aux_aot
+
+assert aux_aot.aot_run(1.5, 2.0) == (1.5 + 2.0 + 2.172) * (1.5 * 2.0)
+assert aux_aot.aot_mul(3, 4) == 12
+assert len(aux_aot.aot_add_BIND_JIT_SFX_jit.overloads) == 0
+assert len(aux_aot.aot_mul_BIND_JIT_SFX_jit.overloads) == 0
+assert getattr(aux_aot, f'aot_add_BIND_JIT_SFX{SELECT_SFX}').linked == {'aot_add_BIND_JIT_SFX'}
+assert 'aot_add_BIND_JIT_SFX' in aot_symbols
+"""
+
+
+def test_build_shared_library(tmp_path):
+    lib_path = str(tmp_path / 'libaux_aot.so')
+    main(['build-so', 'test.aux_aot', '-o', lib_path])
+    with open(get_manifest_path(lib_path)) as f:
+        manifest = json.load(f)
+    assert manifest['skipped'] == []
+    assert manifest['symbols']['aot_add_BIND_JIT_SFX']['sig'] == '(float64, float64) -> float64'
+    assert manifest['symbols']['aot_add_BIND_JIT_SFX']['abi'] == 'c'
+    assert 'readnone' in manifest['symbols']['aot_add_BIND_JIT_SFX']['attrs']
+    assert manifest['symbols']['aot_mul_xx_BIND_JIT_SFX']['abi'] == 'native'
+    env = dict(os.environ, **{AOT_LIBS_ENV: lib_path, 'PYTHONPATH': repo_dir})
+    subprocess.run([sys.executable, '-c', check_aot_code], env=env, cwd=repo_dir, check=True)
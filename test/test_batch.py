@@ -0,0 +1,59 @@
+import numba
+import numpy as np
+import pytest
+
+from numba_linking.bind_jit import bind_jit, get_batch
+from numba_linking.registry import bound_functions
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig, batch=True)
+def batched(x, y):
+    return 2.0 * x + y
+
+
+@bind_jit([calculate_sig, numba.int64(numba.int64, numba.int64)], batch='parallel')
+def batched_parallel(x, y):
+    return x * y
+
+
+@bind_jit(lazy=True, batch=True)
+def batched_lazy(x, y):
+    return x - y
+
+
+def test_batch():
+    a = np.arange(10.0)
+    b = np.linspace(0.0, 1.0, 10)
+    assert np.array_equal(get_batch(batched)(a, b), 2.0 * a + b)
+    assert np.array_equal(get_batch(batched)(a, 1.0), 2.0 * a + 1.0)
+    assert np.array_equal(get_batch(batched_parallel)(a, b), a * b)
+    assert np.array_equal(get_batch(batched_parallel)(np.arange(10), 3), np.arange(10) * 3)
+    assert np.array_equal(get_batch(batched_lazy)(a, b), a - b)
+    assert batched(1.0, 2.0) == 4.0
+
+
+@bind_jit([calculate_sig], lazy=True, batch='parallel')
+def batched_deferred(x, y):
+    return x / y
+
+
+def test_batch_deferred():
+    jit_func = bound_functions['batched_deferred_BIND_JIT_SFX'].jit_func
+    assert not jit_func.overloads
+    a = np.arange(1.0, 11.0)
+    assert np.array_equal(get_batch(batched_deferred)(a, a), np.ones(10))
+    assert jit_func.overloads
+
+
+def test_batch_errors():
+    with pytest.raises(ValueError):
+        bind_jit(calculate_sig, batch='cuda')
+    with pytest.raises(ValueError):
+        bind_jit(calculate_sig, batch=True, namespace=False)
+    with pytest.raises(ValueError):
+        @bind_jit(lazy=True, batch='parallel')
+        def batched_unknown(x, y):
+            return x + y
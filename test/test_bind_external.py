@@ -0,0 +1,36 @@
+import ctypes.util
+import numba
+import pytest
+
+from numba_linking.bind_external import bind_external, external_symbols, lib_handles
+
+
+libm = ctypes.util.find_library('m')
+
+fdim_sig = numba.float64(numba.float64, numba.float64)
+fdim = bind_external(libm, 'fdim', fdim_sig, lazy=True)
+fmax = bind_external(libm, 'fmax', fdim_sig)
+
+
+@numba.njit
+def run(x, y):
+    return fdim(x, y) + fdim(y, x)
+
+
+def test_bind_external():
+    assert (libm, 'fdim') not in external_symbols
+    assert (libm, 'fmax') in external_symbols
+    assert run(5.0, 3.0) == 2.0
+    assert (libm, 'fdim') in external_symbols
+    assert list(lib_handles) == [libm]
+    run_llvm = next(iter(run.inspect_llvm().values()))
+    assert 'declare double @fdim(double, double)' in run_llvm
+    assert fdim(1.0, 4.0) == 0.0
+
+
+def test_bind_external_conflict(tmp_path):
+    other_lib = tmp_path / 'libother.so'
+    other_lib.touch()
+    with pytest.raises(ValueError):
+        bind_external(str(other_lib), 'fdim', fdim_sig, lazy=True)
+    assert bind_external(libm, 'fdim', fdim_sig, lazy=True)(4.0, 1.0) == 3.0
@@ -1,9 +1,13 @@
 import ctypes
+import pytest
 import types
 
 import numba
 from collections import namedtuple
-from numba_linking.bind_jit import bind_jit, get_func_data, make_code_str
+from numba_linking.bind_jit import (
+    bind_jit, get_compiled_dispatcher, get_func_data, get_symbol_name, make_code_str, BIND_JIT_SFX
+)
+from numba_linking.registry import bound_functions
 from test.aux_structrefs import S1, S1Type
 
 
@@ -103,6 +107,7 @@ def aux_3(x, y):
 def test_jit_func_3():
     func_data = get_func_data(aux_3, sig)
     _asserts(func_data, aux_3, assert_py_func=False)
+    assert func_data.ns[f'{func_data.func_name}_jit'] is aux_3
 
 
 @numba.njit([numba.float64(numba.float64, numba.int64), sig])
@@ -113,6 +118,26 @@ def aux_4(x, y):
 def test_jit_func_4():
     func_data = get_func_data(aux_4, sig)
     _asserts(func_data, aux_4, assert_py_func=False)
+    assert func_data.ns[f'{func_data.func_name}_jit'] is aux_4
+
+
+@numba.njit(sig)
+def aux_3_options(x, y):
+    return x + y
+
+
+@numba.njit(sig, fastmath=True)
+def aux_3_fastmath(x, y):
+    return x + y
+
+
+def test_jit_func_3_options():
+    func_data = get_func_data(aux_3_options, sig, dict(fastmath=True))
+    jit_func = func_data.ns[f'{func_data.func_name}_jit']
+    assert jit_func is not aux_3_options and jit_func.targetoptions['fastmath'] is True
+    func_data = get_func_data(aux_3_fastmath, sig, dict(fastmath=True))
+    assert func_data.ns[f'{func_data.func_name}_jit'] is aux_3_fastmath
+    assert get_compiled_dispatcher(aux_3_fastmath, [sig], dict(fastmath=True, cache=True)) is None
 
 
 @numba.njit([numba.float64(numba.float64, numba.int64), numba.int8(numba.int8, numba.int8)])
@@ -123,6 +148,7 @@ def aux_5(x, y):
 def test_jit_func_5():
     func_data = get_func_data(aux_5, sig)
     _asserts(func_data, aux_5, assert_py_func=False)
+    assert func_data.ns[f'{func_data.func_name}_jit'] is not aux_5
 
 
 @numba.cfunc(numba.float64(numba.float64, numba.int64))
@@ -143,6 +169,8 @@ def aux_7(x, y):
 def test_jit_func_7():
     func_data = get_func_data(aux_7, sig)
     _asserts(func_data, aux_7, assert_py_func=False)
+    assert func_data.func_p == aux_7.address
+    assert len(func_data.ns[f'{func_data.func_name}_jit'].overloads) == 0
 
 
 def _asserts(func_data, func, assert_py_func=True):
@@ -166,6 +194,7 @@ def _calculation(typingctx, x, y):
             [context.get_value_type(arg) for arg in sig.args]
         )
         calculation_ = cgutils.get_or_insert_function(builder.module, func_t, "calculation")
+        set_function_attributes(calculation_, calculation_attrs)
         return builder.call(calculation_, args)
     return sig, codegen
 
@@ -248,6 +277,159 @@ def test_global_ns():
     assert str(egg) in define_llvm
 
 
+multi_sigs = [numba.float64(numba.float64, numba.float64), numba.int64(numba.int64, numba.int64)]
+
+
+@bind_jit(multi_sigs, cache=True)
+def aux_11(x, y):
+    return x * y + 3
+
+
+@numba.njit
+def run11(x, y):
+    return 2 * aux_11(x, y)
+
+
+def test_multi_sig():
+    assert run11(1.5, 2.0) == 2 * (1.5 * 2.0 + 3)
+    assert run11(3, 4) == 2 * (3 * 4 + 3)
+    assert isinstance(run11(3, 4), int)
+    run11_llvm = '\n'.join(run11.inspect_llvm().values())
+    for sig_ in multi_sigs:
+        symbol = get_symbol_name(globals()["aux_11_BIND_JIT_SFX_py"], sig_)
+        assert symbol.endswith(BIND_JIT_SFX)
+        assert f"@{symbol}(" in run11_llvm
+    assert aux_11(1.5, 2.0) == 1.5 * 2.0 + 3
+
+
+@bind_jit()
+def aux_12(x):
+    return x + egg
+
+
+@numba.njit
+def run12(x):
+    return 2 * aux_12(x)
+
+
+def test_lazy_sig():
+    aux_12_py = globals()['aux_12_BIND_JIT_SFX_py']
+    assert len(globals()['aux_12_BIND_JIT_SFX_jit'].overloads) == 0
+    assert abs(run12(1.5) - 2 * (1.5 + egg)) < 1e-15
+    assert abs(run12(numba.float32(1.5)) - 2 * (numba.float32(1.5) + egg)) < 1e-6
+    run12_llvm = '\n'.join(run12.inspect_llvm().values())
+    assert f"@{get_symbol_name(aux_12_py, numba.float64(numba.float64))}(" in run12_llvm
+    assert f"@{get_symbol_name(aux_12_py, numba.float64(numba.float32))}(" in run12_llvm
+    assert str(egg) not in run12_llvm
+
+
+@bind_jit(calculate_sig, lazy=True, cache=True)
+def aux_13(x, y):
+    return x - y + egg
+
+
+@numba.njit
+def run13(x, y):
+    return 3.14 * aux_13(x, y)
+
+
+def test_lazy():
+    selector = globals()['aux_13_BIND_JIT_SFX_select']
+    assert len(globals()['aux_13_BIND_JIT_SFX_jit'].overloads) == 0
+    assert len(aux_13.overloads) == 0
+    assert selector.linked == set()
+    x1 = 4.5
+    x2 = 1.2
+    assert abs(run13(x1, x2) - 3.14 * (x1 - x2 + egg)) < 1e-15
+    assert selector.linked == {'aux_13_BIND_JIT_SFX'}
+    assert 'declare double @aux_13_BIND_JIT_SFX(double, double)' in next(iter(run13.inspect_llvm().values()))
+    assert abs(aux_13(3, 2) - (3 - 2 + egg)) < 1e-15
+
+
+@bind_jit(calculate_sig, abi='native')
+def aux_14(x, y):
+    if x < 0:
+        raise ValueError("negative x")
+    return x + y + egg
+
+
+@numba.njit(calculate_sig)
+def run14(x, y):
+    return 3.14 * aux_14(x, y)
+
+
+def test_native_abi():
+    x1 = 4.5
+    x2 = 1.2
+    assert abs(run14(x1, x2) - 3.14 * (x1 + x2 + egg)) < 1e-15
+    run14_llvm = next(iter(run14.inspect_llvm().values()))
+    assert 'declare i32 @aux_14_BIND_JIT_SFX(double*' in run14_llvm
+    assert str(egg) not in run14_llvm
+    with pytest.raises(ValueError, match="negative x"):
+        run14(-x1, x2)
+
+
+@bind_jit(multi_sigs, lazy=True, namespace=False)
+def aux_15(x, y):
+    return x * y + 5
+
+
+@bind_jit(calculate_sig, abi='native', namespace=False)
+def aux_16(x, y):
+    return x - y + egg
+
+
+@numba.njit
+def run15(x, y):
+    return aux_15(x, y) + aux_16(x, y)
+
+
+def test_namespace():
+    assert not [name for name in globals() if name.startswith(('aux_15_', 'aux_16_'))]
+    selector = bound_functions['aux_15_BIND_JIT_SFX']
+    assert selector.linked == set()
+    assert len(aux_15.overloads) == 0
+    assert abs(run15(1.5, 2.0) - (1.5 * 2.0 + 5 + 1.5 - 2.0 + egg)) < 1e-15
+    assert selector.linked == {get_symbol_name(selector.func_data.func_py, multi_sigs[0])}
+    assert aux_15(3, 4) == 17
+    assert selector.linked == {get_symbol_name(selector.func_data.func_py, sig_) for sig_ in multi_sigs}
+    run15_llvm = next(iter(run15.inspect_llvm().values()))
+    assert 'declare i32 @aux_16_BIND_JIT_SFX(double*' in run15_llvm
+    assert str(egg) not in run15_llvm
+
+
+@bind_jit(calculate_sig, inline='auto')
+def aux_17(x, y):
+    return x * y + egg
+
+
+@bind_jit(calculate_sig, inline='auto', inline_budget=10)
+def aux_18(x, y):
+    s = 0.0
+    for i in range(int(x)):
+        s += (y + i) ** 0.5 / (1.0 + i * egg)
+    return s
+
+
+@numba.njit
+def run17(x, y):
+    return aux_17(x, y) + aux_18(x, y)
+
+
+def test_inline_auto():
+    assert run17(3.0, 2.0) == aux_17(3.0, 2.0) + aux_18(3.0, 2.0)
+    assert list(bound_functions['aux_17_BIND_JIT_SFX'].inlined) == ['aux_17_BIND_JIT_SFX']
+    assert bound_functions['aux_18_BIND_JIT_SFX'].inlined == {}
+    run17_llvm = next(iter(run17.inspect_llvm().values()))
+    # declared for the dependency records of cached callers, but never called
+    assert not any('call' in line and '@aux_17_BIND_JIT_SFX' in line for line in run17_llvm.splitlines())
+    assert 'declare i32 @aux_17_BIND_JIT_SFX(' in run17_llvm
+    assert str(egg) in run17_llvm
+    assert 'declare double @aux_18_BIND_JIT_SFX(double, double)' in run17_llvm
+    with pytest.raises(ValueError):
+        bind_jit(calculate_sig, inline='auto', swappable=True)
+
+
 if __name__ == '__main__':
     test_njit()
     test_bind_jit()
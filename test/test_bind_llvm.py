@@ -0,0 +1,101 @@
+import llvmlite.binding as ll
+import numba
+import os
+import pytest
+
+import numba_linking
+from numba_linking.bind_llvm import bind_llvm
+from numba_linking.orc import get_orc_linker
+
+
+add_sig = numba.float64(numba.float64, numba.float64)
+
+calc_ll_path = os.path.join(os.path.dirname(numba_linking.__file__), 'calc.ll')
+
+fma_ir = """
+define double @bind_llvm_fma(double %x, double %y, double %z) {
+  %xy = fmul double %x, %y
+  %res = fadd double %xy, %z
+  ret double %res
+}
+"""
+
+sub_ir = """
+define i64 @bind_llvm_sub(i64 %x, i64 %y) {
+  %res = sub i64 %x, %y
+  ret i64 %res
+}
+"""
+
+orc_scale_ir = """
+define double @bind_llvm_scale(double %x) {
+  %res = fmul double %x, 3.0
+  ret double %res
+}
+"""
+
+orc_poly_ir = """
+declare double @bind_llvm_scale(double)
+
+define double @bind_llvm_poly(double %x) {
+  %x3 = call double @bind_llvm_scale(double %x)
+  %res = fadd double %x3, 1.0
+  ret double %res
+}
+"""
+
+orc_cube_ir = """
+define double @bind_llvm_cube(double %x) {
+  %x2 = fmul double %x, %x
+  %res = fmul double %x2, %x
+  ret double %res
+}
+"""
+
+add = bind_llvm(calc_ll_path, 'add', add_sig)
+fma = bind_llvm(fma_ir, 'bind_llvm_fma', numba.float64(numba.float64, numba.float64, numba.float64), link='separate')
+sub = bind_llvm(ll.parse_assembly(sub_ir).as_bitcode(), 'bind_llvm_sub', numba.int64(numba.int64, numba.int64))
+
+poly = bind_llvm(orc_poly_ir, 'bind_llvm_poly', numba.float64(numba.float64), link='orc')
+bind_llvm(orc_scale_ir, 'bind_llvm_scale', numba.float64(numba.float64), link='orc')
+cube = bind_llvm(orc_cube_ir, 'bind_llvm_cube', numba.float64(numba.float64), link='orc')
+
+
+@numba.njit
+def run(x, y):
+    return add(x, y) * fma(x, y, 1.0) + sub(7, 3)
+
+
+def test_bind_llvm():
+    assert run(2.0, 3.0) == (2.0 + 3.0) * (2.0 * 3.0 + 1.0) + 4
+    assert fma(2.0, 3.0, 1.0) == 7.0
+    run_llvm = next(iter(run.inspect_llvm().values()))
+    assert 'declare double @bind_llvm_fma(double, double, double)' in run_llvm
+    assert 'declare double @add' not in run_llvm
+    assert 'declare i64 @bind_llvm_sub' not in run_llvm
+
+
+def test_bind_llvm_orc():
+    linker = get_orc_linker()
+    assert not linker.is_materialized('bind_llvm_poly')
+    assert poly(2.0) == 7.0
+    assert linker.is_materialized('bind_llvm_poly')
+    assert not linker.is_materialized('bind_llvm_scale')
+    assert linker.get_address('bind_llvm_scale') != linker.get_address('bind_llvm_poly')
+
+
+def test_bind_llvm_orc_looked_up():
+    # looked up in the session before any caller is compiled
+    assert get_orc_linker().get_address('bind_llvm_cube')
+
+    @numba.njit
+    def run_cube(x):
+        return cube(x) + 1.0
+    assert run_cube(2.0) == 9.0
+
+
+def test_bind_llvm_errors():
+    with pytest.raises(ValueError):
+        bind_llvm(fma_ir, 'bind_llvm_fma', add_sig, link='dynamic')
+    with pytest.raises(NameError):
+        bind_llvm(fma_ir, 'missing', add_sig)
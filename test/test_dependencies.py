@@ -0,0 +1,94 @@
+import numba
+import os
+import subprocess
+import sys
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.dependencies import checked_njit, get_dependency
+from numba_linking.registry import bound_symbols, symbol_attributes
+
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig)
+def dependency(x, y):
+    return x + y
+
+
+@checked_njit(calculate_sig, cache=True)
+def run(x, y):
+    return 2.0 * dependency(x, y)
+
+
+def test_dependencies(monkeypatch):
+    assert run(1.0, 2.0) == 6.0
+    cache = run._cache
+    symbol = 'dependency_BIND_JIT_SFX'
+    assert cache.load_dependencies()[cache.get_key(calculate_sig)] == {symbol: get_dependency(bound_symbols[symbol])}
+    assert cache.load_overload(calculate_sig, run.targetctx) is not None
+
+    with monkeypatch.context() as m:
+        m.setitem(symbol_attributes, symbol, frozenset(['readnone']) ^ symbol_attributes[symbol])
+        assert cache.load_overload(calculate_sig, run.targetctx) is None
+    with monkeypatch.context() as m:
+        m.setitem(bound_symbols, symbol, bound_symbols[symbol]._replace(jit_func=numba.njit(lambda x, y: x - y)))
+        assert cache.load_overload(calculate_sig, run.targetctx) is None
+    with monkeypatch.context() as m:
+        m.setattr(cache, 'get_key', lambda sig: 'missing')
+        assert cache.load_overload(calculate_sig, run.targetctx) is None
+    with open(cache.deps_path) as f:
+        deps = f.read()
+    try:
+        with open(cache.deps_path, 'w') as f:
+            f.write(deps[:len(deps) // 2])
+        assert cache.load_overload(calculate_sig, run.targetctx) is None
+    finally:
+        with open(cache.deps_path, 'w') as f:
+            f.write(deps)
+    assert cache.load_overload(calculate_sig, run.targetctx) is not None
+
+    stale_sig = numba.float32(numba.float32, numba.float32)
+    monkeypatch.setitem(bound_symbols, symbol, bound_symbols[symbol]._replace(sig=stale_sig))
+    assert cache.load_overload(calculate_sig, run.targetctx) is None
+    monkeypatch.delitem(bound_symbols, symbol)
+    assert cache.load_overload(calculate_sig, run.targetctx) is None
+
+
+inlined_callee_code = """
+import numba
+from numba_linking.bind_jit import bind_jit
+
+
+@bind_jit(numba.float64(numba.float64, numba.float64), inline='auto', cache=True)
+def inlined_dependency(x, y):
+    return x {op} y
+"""
+
+inlined_caller_code = """
+from numba_linking.dependencies import checked_njit
+from inlined_callee import inlined_dependency
+
+
+@checked_njit(cache=True)
+def inlined_run(x, y):
+    return 2.0 * inlined_dependency(x, y)
+"""
+
+
+def test_inlined_dependencies(tmp_path):
+    """ A cached caller the callee is inlined into is compiled again once the callee changes """
+    with open(tmp_path / 'inlined_caller.py', 'w') as f:
+        f.write(inlined_caller_code)
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path / 'cache'), PYTHONPATH=f"{repo_dir}{os.pathsep}{tmp_path}")
+    for op, expected, cache_hit in (('+', 6.0, False), ('+', 6.0, True), ('-', -2.0, False)):
+        with open(tmp_path / 'inlined_callee.py', 'w') as f:
+            f.write(inlined_callee_code.format(op=op))
+        code = f"""
+from inlined_caller import inlined_run
+assert inlined_run(1.0, 2.0) == {expected}
+assert bool(inlined_run.stats.cache_hits) == {cache_hit}
+"""
+        subprocess.run([sys.executable, '-B', '-c', code], env=env, cwd=tmp_path, check=True)
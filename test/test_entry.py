@@ -0,0 +1,38 @@
+import numba
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.entry import get_entry_point
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig)
+def entry(x, y):
+    return x * y + 1.0
+
+
+@bind_jit(lazy=True)
+def entry_lazy(x, y):
+    return x - y
+
+
+@bind_jit(calculate_sig, namespace=False)
+def entry_registry(x, y):
+    return x + y
+
+
+def test_entry_point():
+    entry_ = get_entry_point(entry)
+    assert entry_(2.0, 3.0) == 7.0
+    assert get_entry_point(entry) is entry_
+    assert get_entry_point(entry, nogil=False)(2.0, 3.0) == 7.0
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(entry_, range(100), range(100))) == [x * x + 1.0 for x in range(100)]
+    with pytest.raises(ValueError):
+        get_entry_point(entry_lazy)
+    assert get_entry_point(entry_lazy, numba.int64(numba.int64, numba.int64))(5, 3) == 2
+    with pytest.raises(ValueError):
+        get_entry_point(entry_registry)
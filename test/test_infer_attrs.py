@@ -0,0 +1,64 @@
+import numba
+import numpy as np
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.infer_attrs import infer_attributes
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+array_sig = numba.float64(numba.float64[:])
+
+
+@bind_jit(calculate_sig)
+def pure(x, y):
+    return x * y + 1.0
+
+
+@bind_jit(array_sig)
+def reads_array(a):
+    return a[0]
+
+
+@bind_jit(array_sig, abi='native')
+def reads_array_native(a):
+    return a[0]
+
+
+@numba.njit(calculate_sig)
+def raises(x, y):
+    if x < 0:
+        raise ValueError("negative x")
+    return x + y
+
+
+@numba.njit
+def run(a, x, y):
+    s = 0.0
+    for i in range(a.size):
+        s += a[i] * pure(x, y) + reads_array(a) + reads_array_native(a)
+    return s
+
+
+def _declaration_attrs(llvm_str, symbol):
+    declare = next(line for line in llvm_str.splitlines() if line.startswith('declare') and f'@{symbol}(' in line)
+    group = declare.split()[-1]
+    attrs = next(line for line in llvm_str.splitlines() if line.startswith(f'attributes {group} '))
+    return set(attrs.split('{')[1].split('}')[0].split())
+
+
+def test_declaration_attributes():
+    a = np.arange(10.0)
+    assert run(a, 2.0, 3.0) == (a * 7.0).sum() + 2 * a.size * a[0]
+    run_llvm = next(iter(run.inspect_llvm().values()))
+    assert {'readnone', 'nounwind', 'willreturn', 'nosync'} <= _declaration_attrs(run_llvm, 'pure_BIND_JIT_SFX')
+    reads_array_attrs = _declaration_attrs(run_llvm, 'reads_array_BIND_JIT_SFX')
+    assert 'readonly' in reads_array_attrs
+    assert 'readnone' not in reads_array_attrs
+    assert 'argmemonly' in _declaration_attrs(run_llvm, 'reads_array_native_BIND_JIT_SFX')
+    assert run_llvm.count('call double @pure_BIND_JIT_SFX(') == 1
+
+
+def test_raising_callee():
+    cres = raises.overloads[calculate_sig.args]
+    assert not {'readnone', 'readonly'} & infer_attributes(cres)
+    assert 'argmemonly' in infer_attributes(cres, native=True)
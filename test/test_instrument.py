@@ -0,0 +1,50 @@
+import numba
+import numpy as np
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.instrument import counter_slots, get_counters, get_counts, reset_counters
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig, instrument=True)
+def counted(x, y):
+    return x + y
+
+
+@bind_jit(calculate_sig, abi='native', instrument='cycles')
+def timed(x, y):
+    return x * y
+
+
+@bind_jit(calculate_sig)
+def not_counted(x, y):
+    return x - y
+
+
+@numba.njit
+def run(a):
+    s = 0.0
+    for x in a:
+        s += counted(x, 1.0) + timed(x, 2.0) + not_counted(x, 3.0)
+    return s
+
+
+def test_counters():
+    reset_counters()
+    a = np.arange(100.0)
+    assert run(a) == (a + 1.0 + a * 2.0 + a - 3.0).sum()
+    assert get_counts('counted_BIND_JIT_SFX') == (a.size, 0)
+    calls, cycles = get_counts('timed_BIND_JIT_SFX')
+    assert calls == a.size
+    assert cycles > 0
+    assert 'not_counted_BIND_JIT_SFX' not in counter_slots
+    counters = get_counters()
+    assert counters.dtype == np.uint64
+    assert counters[counter_slots['counted_BIND_JIT_SFX'], 0] == a.size
+    run_llvm = next(iter(run.inspect_llvm().values()))
+    assert '@counted_BIND_JIT_SFX_COUNTER = external global [2 x i64]' in run_llvm
+    assert 'not_counted_BIND_JIT_SFX_COUNTER' not in run_llvm
+    reset_counters()
+    assert get_counts('counted_BIND_JIT_SFX') == (0, 0)
@@ -0,0 +1,57 @@
+import numba
+import numpy as np
+import pytest
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.jump_table import JumpTable
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig)
+def strategy_add(x, y):
+    return x + y
+
+
+@bind_jit([calculate_sig], lazy=True)
+def strategy_mul(x, y):
+    return x * y
+
+
+@bind_jit(namespace=False)
+def strategy_sub(x, y):
+    return x - y
+
+
+@bind_jit(calculate_sig, abi='native')
+def strategy_native(x, y):
+    return x / y
+
+
+table = JumpTable([strategy_add, strategy_mul, strategy_sub], calculate_sig)
+
+
+@numba.njit
+def run(ks, x, y):
+    s = 0.0
+    for k in ks:
+        s += table[k](x, y)
+    return s
+
+
+@numba.njit
+def run_k(k):
+    return table[k](6.0, 3.0)
+
+
+def test_jump_table():
+    assert len(table) == 3
+    assert run(np.array([0, 1, 2, 1]), 6.0, 3.0) == 9.0 + 18.0 + 3.0 + 18.0
+    run_llvm = next(iter(run.inspect_llvm().values()))
+    assert 'declare double @strategy_add_BIND_JIT_SFX(double, double)' in run_llvm
+    assert 'private unnamed_addr constant [3 x i8*]' in run_llvm
+    with pytest.raises(IndexError):
+        run_k(3)
+    with pytest.raises(ValueError):
+        JumpTable([strategy_native], calculate_sig)
@@ -0,0 +1,56 @@
+import numba
+import numpy as np
+import pytest
+from numba.core import config
+from numba.core.registry import cpu_target
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.multiversion import Variant, VariantTarget, get_default_variants, select_variant
+from numba_linking.registry import bound_functions
+
+
+dot_sig = numba.float64(numba.float64[::1], numba.float64[::1])
+
+
+@bind_jit(dot_sig, multiversion=True)
+def mv_dot(a, b):
+    s = 0.0
+    for i in range(a.size):
+        s += a[i] * b[i]
+    return s
+
+
+@numba.njit
+def run(a, b):
+    return mv_dot(a, b) + 1.0
+
+
+def test_select_variant():
+    assert select_variant([Variant('none', 'x86-64', ('no-such-feature',))]) is None
+    baseline = Variant('baseline', 'generic', ())
+    assert select_variant([baseline]) is baseline
+    variant = select_variant()
+    assert variant is None or variant in get_default_variants()
+
+
+def test_multiversion():
+    a = np.arange(100.0)
+    assert run(a, a) == (a * a).sum() + 1.0
+    selector = bound_functions['mv_dot_BIND_JIT_SFX']
+    variant = select_variant()
+    assert selector.variant == variant
+    if variant is not None:
+        assert selector.impl_func.targetdescr.variant == variant
+        assert len(selector.jit_func.overloads) == 0
+        if variant.name in ('x86-64-v3', 'x86-64-v4'):
+            assert 'ymm' in selector.impl_func.inspect_asm(dot_sig.args)
+
+
+@pytest.mark.skipif(not get_default_variants(), reason="x86-64 variants")
+def test_variant_target():
+    config_cpu = config.CPU_NAME, config.CPU_FEATURES
+    variant = Variant('v2', 'x86-64-v2', ('sse4.2', 'popcnt'))
+    variant_codegen = VariantTarget(variant).target_context.codegen()
+    assert variant_codegen.magic_tuple()[1:] == ('x86-64-v2', '+sse4.2,+popcnt')
+    assert (config.CPU_NAME, config.CPU_FEATURES) == config_cpu
+    assert cpu_target.target_context.codegen().magic_tuple() != variant_codegen.magic_tuple()
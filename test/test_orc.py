@@ -0,0 +1,45 @@
+import ctypes
+import llvmlite.binding as ll
+import pytest
+
+from numba_linking.orc import OrcLinker
+
+
+add_ir = """
+define double @orc_add(double %x, double %y) {
+  %res = fadd double %x, %y
+  ret double %res
+}
+"""
+
+run_ir = """
+declare double @orc_add(double, double)
+
+define double @orc_run(double %x, double %y) {
+  %sum = call double @orc_add(double %x, double %y)
+  %res = fmul double %sum, 3.0
+  ret double %res
+}
+"""
+
+unused_ir = """
+define double @orc_unused(double %x) {
+  ret double %x
+}
+"""
+
+
+def test_orc_linker():
+    linker = OrcLinker()
+    # added before the module defining the symbol it declares
+    assert linker.add_module(linker.prepare_module(ll.parse_assembly(run_ir)), 'run') == {'orc_run'}
+    linker.add_module(linker.prepare_module(ll.parse_assembly(add_ir)), 'add')
+    linker.add_module(linker.prepare_module(ll.parse_assembly(unused_ir)), 'unused')
+    assert not linker.trackers
+    run = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double, ctypes.c_double)(linker.get_address('orc_run'))
+    assert run(1.0, 2.0) == 9.0
+    assert 'add' in linker.trackers
+    assert 'unused' not in linker.trackers
+    assert linker.is_materialized('orc_run') and not linker.is_materialized('orc_unused')
+    with pytest.raises(ValueError):
+        linker.add_module(linker.prepare_module(ll.parse_assembly(add_ir)), 'add_again')
@@ -0,0 +1,106 @@
+import numba
+import os
+import pytest
+import struct
+import subprocess
+import sys
+
+from numba_linking import perf
+from numba_linking.bind_jit import bind_jit
+from numba_linking.bind_llvm import bind_llvm
+from numba_linking.registry import bound_functions
+
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig, lazy=True)
+def perf_add(x, y):
+    return x + y
+
+
+@bind_jit([calculate_sig], lazy=True, abi='native')
+def perf_mul(x, y):
+    return x * y
+
+
+@numba.njit
+def run(x, y):
+    return perf_add(x, y) + perf_mul(x, y)
+
+
+@pytest.fixture
+def perf_enabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(perf, 'PERF_DIR', str(tmp_path))
+    monkeypatch.setattr(perf, 'enabled_modes', frozenset())
+    monkeypatch.setattr(perf, 'jitdump_file', None)
+    monkeypatch.setattr(perf, 'jitdump_marker', None)
+    perf.enable_perf()
+    yield
+    perf.close_jitdump()
+
+
+def test_perf(perf_enabled):
+    assert run(2.0, 3.0) == 11.0
+
+    with open(perf.get_perf_map_path()) as f:
+        entries = {name: (int(address, 16), int(size, 16)) for address, size, name in (line.split(' ', 2) for line in f)}
+    add_address, add_size = entries['perf_add_BIND_JIT_SFX float64(float64, float64)\n']
+    cres = bound_functions['perf_add_BIND_JIT_SFX'].jit_func.overloads[calculate_sig.args]
+    assert add_address == cres.library.get_pointer_to_function(cres.fndesc.llvm_cfunc_wrapper_name)
+    assert 0 < add_size < 4096
+    assert 'perf_mul_dd_BIND_JIT_SFX float64(float64, float64)\n' in entries
+    assert any('perf_add' in name and name.startswith('_ZN') for name in entries)
+
+    perf.close_jitdump()
+    assert perf.jitdump_file is None and perf.enabled_modes == {perf.PERF_MAP}
+    with open(perf.get_jitdump_path(), 'rb') as f:
+        dump = f.read()
+    magic, version, header_size, _, _, pid = struct.unpack_from('<IIIIII', dump)
+    assert (magic, version, header_size, pid) == (perf.JITDUMP_MAGIC, perf.JITDUMP_VERSION, 40, os.getpid())
+    offset, names = header_size, []
+    while offset < len(dump):
+        record_id, total_size = struct.unpack_from('<II', dump, offset)
+        assert record_id == perf.JIT_CODE_LOAD
+        names.append(dump[offset + 56:dump.index(b'\0', offset + 56)].decode())
+        offset += total_size
+    assert offset == len(dump)
+    assert sorted(names) == sorted(name[:-1] for name in entries)
+
+
+perf_scale_ir = """
+define double @perf_scale(double %x) {
+  %res = fmul double %x, 3.0
+  ret double %res
+}
+"""
+
+
+def test_perf_bind_llvm(perf_enabled):
+    scale = bind_llvm(perf_scale_ir, 'perf_scale', numba.float64(numba.float64), link='separate')
+    assert scale(2.0) == 6.0
+    with open(perf.get_perf_map_path()) as f:
+        assert any(line.endswith(' perf_scale float64(float64)\n') for line in f)
+
+
+check_perf_cached_code = """
+import os
+from numba_linking import perf
+import test.aux_aot as aux_aot
+
+assert aux_aot.aot_add.stats.cache_hits
+with open(perf.get_perf_map_path()) as f:
+    assert any(line.endswith(' aot_add_BIND_JIT_SFX float64(float64, float64)\\n') for line in f)
+os.unlink(perf.get_perf_map_path())
+"""
+
+
+def test_perf_cached(tmp_path):
+    """ The code of a callee loaded from cache is described from its module, the engine took its object code """
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path), PYTHONPATH=repo_dir)
+    subprocess.run([sys.executable, '-c', 'import test.aux_aot'], env=env, cwd=repo_dir, check=True)
+    env[perf.PERF_ENV] = perf.PERF_MAP
+    subprocess.run([sys.executable, '-c', check_perf_cached_code], env=env, cwd=repo_dir, check=True)
@@ -0,0 +1,38 @@
+from numba_linking.__main__ import main
+import test.aux_aot  # noqa: F401
+from numba_linking.precompile import get_wrapper, group_symbols, precompile, precompile_symbol
+from numba_linking.registry import bound_functions, get_package_symbols
+
+
+def test_precompile(tmp_path, monkeypatch):
+    monkeypatch.setenv('NUMBA_CACHE_DIR', str(tmp_path))
+    records = precompile('test.aux_aot', max_workers=2)
+    assert sorted(record.symbol for record in records) == [
+        'aot_add_BIND_JIT_SFX', 'aot_mul_dd_BIND_JIT_SFX', 'aot_mul_xx_BIND_JIT_SFX'
+    ]
+    assert not any(record.cache_hit for record in records)
+    assert all(record.module == 'test.aux_aot' for record in records)
+    assert all(record.cacheable for record in records)
+    assert all(record.cache_hit for record in precompile('test.aux_aot', max_workers=2))
+
+
+def test_group_symbols():
+    # the signatures of aot_mul are compiled by one dispatcher, into one cache index
+    assert group_symbols(get_package_symbols('test.aux_aot')) == {
+        ('test.aux_aot', 'aot_add_BIND_JIT_SFX'): ['aot_add_BIND_JIT_SFX'],
+        ('test.aux_aot', 'aot_mul_BIND_JIT_SFX'): ['aot_mul_dd_BIND_JIT_SFX', 'aot_mul_xx_BIND_JIT_SFX'],
+    }
+
+
+def test_precompile_cli(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv('NUMBA_CACHE_DIR', str(tmp_path))
+    main(['precompile', 'test.aux_aot', '-j', '1'])
+    assert "3 functions, 0 cache hits, 3 cache misses, 0 not cacheable" in capsys.readouterr().out
+
+
+def test_precompile_not_cacheable():
+    symbol = 'resolve_add_BIND_JIT_SFX'
+    record = precompile_symbol('test.aux_resolve', symbol)
+    assert record.cacheable is False and record.cache_hit is False
+    assert symbol in bound_functions[symbol].linked
+    assert get_wrapper('test.aux_resolve', symbol).signatures
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+
+from numba_linking.registry import add_resolver, bound_symbols, resolve_symbol, resolvers, specialize_symbol, specializers
+
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+check_resolve_code = """
+import sys
+from numba_linking.registry import bound_symbols
+import test.aux_resolve as aux_resolve
+
+assert 'resolve_mul_dd_BIND_JIT_SFX' not in bound_symbols
+assert aux_resolve.resolve_run(2.0, 3.0) == 30.0
+assert (sum(aux_resolve.resolve_run.stats.cache_hits.values()) > 0) == (sys.argv[1] == 'warm')
+assert 'resolve_mul_dd_BIND_JIT_SFX' in bound_symbols
+"""
+
+
+def test_resolve_cached_caller(tmp_path):
+    """ The warm process loads `resolve_run` from cache, before typing made its lazy callees link their symbols """
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path), PYTHONPATH=repo_dir)
+    for run in ('cold', 'warm'):
+        subprocess.run([sys.executable, '-c', check_resolve_code, run], env=env, cwd=repo_dir, check=True)
+
+
+check_cached_code = """
+import sys
+import test.aux_cached as aux_cached
+
+assert aux_cached.cached_run(3.0, 2.0) == 13.5
+assert (sum(aux_cached.cached_run.stats.cache_hits.values()) > 0) == (sys.argv[1] == 'warm')
+# the specialization of cached_pow is not cached, its caller is compiled again
+assert aux_cached.cached_pow_run(3.0, 2.0) == 9.0
+assert not aux_cached.cached_pow_run.stats.cache_hits
+"""
+
+
+def test_plain_cached_caller(tmp_path):
+    """
+    A plain `numba.njit(cache=True)` caller loaded from cache links the lazy symbols it declares,
+    and the specializations of `bind_jit(cache=True)` functions typed in the cold process
+    """
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path), PYTHONPATH=repo_dir, NUMBA_LINKING_LAZY='1')
+    for run in ('cold', 'warm'):
+        subprocess.run([sys.executable, '-c', check_cached_code, run], env=env, cwd=repo_dir, check=True)
+
+
+def test_resolver():
+    requested = []
+    add_resolver(requested.append)
+    try:
+        assert not resolve_symbol('unknown_BIND_JIT_SFX')
+        assert requested == ['unknown_BIND_JIT_SFX']
+        assert resolve_symbol('resolve_add_BIND_JIT_SFX', 'test.aux_resolve')
+        assert 'resolve_add_BIND_JIT_SFX' in bound_symbols
+        assert requested == ['unknown_BIND_JIT_SFX']
+    finally:
+        resolvers.remove(requested.append)
+
+
+def test_specialize_symbol(monkeypatch):
+    specialized = []
+    monkeypatch.setitem(specializers, 'spec', specialized.append)
+    specialize_symbol('spec_other_dd_BIND_JIT_SFX', 'float64(float64, float64)')
+    specialize_symbol('spec_dd_BIND_JIT_SFX', 'float64(int64, int64)')
+    assert specialized == []
+    specialize_symbol('spec_dd_BIND_JIT_SFX', 'float64(float64, float64)')
+    assert [str(sig) for sig in specialized] == ['(float64, float64) -> float64']
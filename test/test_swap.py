@@ -0,0 +1,51 @@
+import numba
+import pytest
+
+from numba_linking.bind_jit import bind_jit, rebind
+from numba_linking.swap import get_slot
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig, swappable=True)
+def swapped(x, y):
+    return x + y
+
+
+@bind_jit(calculate_sig, abi='native', swappable=True)
+def swapped_native(x, y):
+    return x + y
+
+
+@bind_jit(calculate_sig)
+def not_swapped(x, y):
+    return x + y
+
+
+@numba.njit(calculate_sig)
+def run(x, y):
+    return swapped(x, y) + 10.0 * swapped_native(x, y)
+
+
+def mul(x, y):
+    return x * y
+
+
+def test_rebind():
+    assert run(3.0, 4.0) == 77.0
+    slot = get_slot('swapped_BIND_JIT_SFX')
+    rebind(swapped, mul)
+    assert get_slot('swapped_BIND_JIT_SFX') != slot
+    assert run(3.0, 4.0) == 82.0
+    rebind(swapped_native, numba.njit(mul))
+    assert run(3.0, 4.0) == 132.0
+    assert swapped(3.0, 4.0) == 12.0
+    run_llvm = next(iter(run.inspect_llvm().values()))
+    assert 'load atomic i8*, i8** @swapped_BIND_JIT_SFX_SLOT monotonic' in run_llvm
+    assert 'declare double @swapped_BIND_JIT_SFX' not in run_llvm
+
+
+def test_rebind_not_swappable():
+    with pytest.raises(ValueError):
+        rebind(not_swapped, mul)
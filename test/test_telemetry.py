@@ -0,0 +1,82 @@
+import json
+import numba
+import os
+import pytest
+import subprocess
+import sys
+
+from numba_linking import telemetry
+from numba_linking.bind_jit import bind_jit
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@pytest.fixture
+def telemetry_enabled():
+    telemetry.enable_telemetry()
+    yield
+    telemetry.disable_telemetry()
+
+
+def test_telemetry(tmp_path, telemetry_enabled):
+    @bind_jit(calculate_sig)
+    def telemetry_add(x, y):
+        return x + y
+
+    @bind_jit([calculate_sig], lazy=True)
+    def telemetry_mul(x, y):
+        return x * y
+
+    @bind_jit(calculate_sig, lazy=True)
+    def telemetry_unused(x, y):
+        return x - y
+
+    @numba.njit
+    def run(x, y):
+        return telemetry_add(x, y) + telemetry_mul(x, y)
+
+    assert run(2.0, 3.0) == 11.0
+    records = {record.symbol: record for record in telemetry.get_compile_records()}
+    assert 'telemetry_unused_BIND_JIT_SFX' not in records
+    add, mul = records['telemetry_add_BIND_JIT_SFX'], records['telemetry_mul_dd_BIND_JIT_SFX']
+    for record in (add, mul):
+        assert record.module == __name__
+        assert record.sig == 'float64(float64, float64)'
+        assert record.callee_s > 0.0
+        assert record.wrapper_address_s > 0.0
+        assert record.wrapper_s > 0.0
+        assert record.ir_size > 0
+        assert record.object_bytes > 0
+        assert not record.cache_hit
+
+    path = tmp_path / 'telemetry.json'
+    telemetry.dump_compile_records(path)
+    with open(path) as f:
+        report = json.load(f)
+    assert {record['symbol'] for record in report['records']} >= set(records)
+    assert report['totals']['object_bytes'] == sum(record['object_bytes'] for record in report['records'])
+
+
+def run_cli(path, cache_dir):
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(cache_dir))
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cmd = [sys.executable, '-m', 'numba_linking', 'telemetry', 'test.aux_aot', '-o', str(path)]
+    out = subprocess.run(cmd, env=env, cwd=root, check=True, capture_output=True, text=True).stdout
+    assert f"{path}: " in out
+    with open(path) as f:
+        return {record['symbol']: record for record in json.load(f)['records']}
+
+
+def test_telemetry_cli(tmp_path):
+    # the second run loads the callees from the cache the first one wrote
+    for cache_hit in (False, True):
+        records = run_cli(tmp_path / 'telemetry.json', tmp_path / 'cache')
+        assert {'aot_add_BIND_JIT_SFX', 'aot_mul_dd_BIND_JIT_SFX'} <= set(records)
+        assert records['aot_add_BIND_JIT_SFX']['cache_hit'] == cache_hit
+        assert records['aot_mul_dd_BIND_JIT_SFX']['cache_hit'] == cache_hit
+        assert records['aot_add_BIND_JIT_SFX']['object_bytes'] > 0
+
+
+def test_telemetry_disabled():
+    assert not telemetry.enabled
@@ -0,0 +1,63 @@
+import numba
+import numpy as np
+import pytest
+
+from numba_linking.bind_jit import bind_jit
+from numba_linking.registry import bound_functions
+from numba_linking.vector_variants import VECTOR_WIDTHS, get_vfabi_name, is_vectorizable
+
+
+calculate_sig = numba.float64(numba.float64, numba.float64)
+
+
+@bind_jit(calculate_sig, vectorize=True)
+def vv_fma(x, y):
+    return x * y + 1.0
+
+
+@bind_jit([numba.int64(numba.int64), numba.boolean(numba.boolean)], lazy=True, vectorize=(4,))
+def vv_twice(x):
+    return x + x
+
+
+@numba.njit
+def run(a, b, out):
+    for i in range(a.size):
+        out[i] = vv_fma(a[i], b[i])
+
+
+@numba.njit
+def run_twice(a, out):
+    for i in range(a.size):
+        out[i] = vv_twice(a[i])
+
+
+def test_vectorize():
+    a, b, out = np.arange(100.0), np.arange(100.0, 200.0), np.empty(100)
+    run(a, b, out)
+    np.testing.assert_array_equal(out, a * b + 1.0)
+    llvm_ir = run.inspect_llvm(run.signatures[0])
+    variants = ','.join(get_vfabi_name('vv_fma_BIND_JIT_SFX', width, 2) for width in VECTOR_WIDTHS)
+    assert f'"vector-function-abi-variant"="{variants}"' in llvm_ir
+    assert 'declare <8 x double> @vv_fma_BIND_JIT_SFX_V8(<8 x double>, <8 x double>)' in llvm_ir
+    assert 'call <4 x double> @vv_fma_BIND_JIT_SFX_V4(' in llvm_ir or 'call <8 x double> @vv_fma_BIND_JIT_SFX_V8(' in llvm_ir
+
+
+def test_vectorize_widths():
+    a, out = np.arange(100), np.empty(100, dtype=np.int64)
+    run_twice(a, out)
+    np.testing.assert_array_equal(out, a + a)
+    assert vv_twice(True)
+    selector = bound_functions['vv_twice_BIND_JIT_SFX']
+    assert sorted(selector.vector_libraries) == ['vv_twice_x_BIND_JIT_SFX']
+    assert 'call <4 x i64> @vv_twice_x_BIND_JIT_SFX_V4(' in run_twice.inspect_llvm(run_twice.signatures[0])
+    assert not is_vectorizable(numba.boolean(numba.boolean))
+
+
+def test_vectorize_errors():
+    with pytest.raises(ValueError):
+        bind_jit(calculate_sig, vectorize=(3,))
+    with pytest.raises(ValueError):
+        bind_jit(calculate_sig, vectorize=True, abi='native')
+    with pytest.raises(ValueError):
+        bind_jit(calculate_sig, vectorize=True, swappable=True)